@@ -2,10 +2,15 @@
 Agent Factory Class - Responsible for creating various independent Agent instances
 """
 
+import asyncio
+import functools
+
+import boto3
 from config import settings
 from strands import Agent, tool
 from strands.models import BedrockModel
 from strands.tools.mcp.mcp_client import MCPClient
+from utils.aws import get_boto_config
 from utils.streamlit_context import StreamlitContext
 from utils.time_tools import TIME_TOOLS
 
@@ -17,14 +22,36 @@ from .prompts.lineage_agent import LINEAGE_AGENT_PROMPT_EN, LINEAGE_AGENT_PROMPT
 
 # Import prompts for each agent
 from .prompts.metadata_agent import METADATA_AGENT_PROMPT_EN, METADATA_AGENT_PROMPT_ZH
-from .prompts.orchestrator_agent import (
-    ORCHESTRATOR_AGENT_PROMPT_EN,
-    ORCHESTRATOR_AGENT_PROMPT_ZH,
-)
-from .prompts.specialist_agent import (
-    SPECIALIST_AGENT_PROMPT_EN,
-    SPECIALIST_AGENT_PROMPT_ZH,
-)
+from .prompts.orchestrator_agent import ORCHESTRATOR_AGENT_PROMPT_BASE
+from .prompts.specialist_agent import SPECIALIST_AGENT_PROMPT_BASE
+
+# Language directive appended to language-neutral prompts
+LANGUAGE_INSTRUCTIONS = {
+    "en": "Please respond in English.",
+    "zh": "用中文回复用户。",
+}
+
+# Agents whose prompt is written per language
+LOCALIZED_PROMPTS = {
+    "metadata": {"en": METADATA_AGENT_PROMPT_EN, "zh": METADATA_AGENT_PROMPT_ZH},
+    "lineage": {"en": LINEAGE_AGENT_PROMPT_EN, "zh": LINEAGE_AGENT_PROMPT_ZH},
+    "datacatalog": {
+        "en": DATACATALOG_AGENT_PROMPT_EN,
+        "zh": DATACATALOG_AGENT_PROMPT_ZH,
+    },
+}
+
+# Agents sharing one prompt, localized only by the language directive
+BASE_PROMPTS = {
+    "orchestrator": ORCHESTRATOR_AGENT_PROMPT_BASE,
+    "specialist": SPECIALIST_AGENT_PROMPT_BASE,
+}
+
+
+@functools.cache
+def get_bedrock_session() -> boto3.Session:
+    """Get the boto3 session shared by all agent models, resolving credentials once"""
+    return boto3.Session()
 
 
 class AgentFactory:
@@ -33,6 +60,7 @@ class AgentFactory:
     def __init__(self, mcp_client: MCPClient):
         self.mcp_client = mcp_client
         self.current_language = "zh"  # Default to Chinese
+        self._mcp_tools = None
 
     def set_language(self, language: str):
         """Set current language"""
@@ -41,30 +69,61 @@ class AgentFactory:
     def get_language_instruction(self) -> str:
         """Get language instruction"""
         if self.current_language == "en":
-            return "Please respond in English."
+            return LANGUAGE_INSTRUCTIONS["en"]
         else:
-            return "用中文回复用户。"
+            return LANGUAGE_INSTRUCTIONS["zh"]
+
+    def get_system_prompt(self, agent_name: str) -> str:
+        """Get system prompt of the given agent for the current language"""
+        if agent_name in BASE_PROMPTS:
+            return f"{BASE_PROMPTS[agent_name]}\n\n{self.get_language_instruction()}"
+
+        prompts = LOCALIZED_PROMPTS[agent_name]
+        if self.current_language == "en":
+            return prompts["en"]
+        else:
+            return prompts["zh"]
+
+    def get_mcp_tools(self) -> list:
+        """Get MCP tools, listed once per MCP session and shared by agents"""
+        if self._mcp_tools is None:
+            self._mcp_tools = self.mcp_client.list_tools_sync()
+        return self._mcp_tools
+
+    def create_model(self) -> BedrockModel:
+        """Create Bedrock model on the shared boto3 session"""
+        cache_config = {}
+        if settings.get("BEDROCK_PROMPT_CACHE", False):
+            # System prompt and tool specs are identical every turn, let Bedrock
+            # reuse the processed prefix instead of re-reading it per call
+            cache_config = {"cache_prompt": "default", "cache_tools": "default"}
+
+        return BedrockModel(
+            boto_session=get_bedrock_session(),
+            # Model responses can take minutes before the first streamed chunk
+            boto_client_config=get_boto_config(
+                max_pool_connections=64, read_timeout=300
+            ),
+            region_name=settings.get("BEDROCK_REGION", "us-west-2"),
+            model_id=settings.get("BEDROCK_MODEL_ID"),
+            max_tokens=settings.get("BEDROCK_MAX_TOKENS", 4000),
+            **cache_config,
+        )
 
     def create_metadata_agent(self) -> Agent:
         """Create independent metadata agent"""
         # Get MCP tools (using shared MCP client)
-        mcp_tools = self.mcp_client.list_tools_sync()
+        mcp_tools = self.get_mcp_tools()
 
         # Merge MCP tools and time tools
         all_tools = mcp_tools + TIME_TOOLS
 
-        if self.current_language == "en":
-            system_prompt = METADATA_AGENT_PROMPT_EN
-        else:
-            system_prompt = METADATA_AGENT_PROMPT_ZH
+        system_prompt = self.get_system_prompt("metadata")
 
         # Create Agent
         agent = Agent(
             tools=all_tools,
-            model=BedrockModel(
-                model_id=settings.get("BEDROCK_MODEL_ID"),
-                max_tokens=settings.get("BEDROCK_MAX_TOKENS", 4000),
-            ),
+            model=self.create_model(),
             system_prompt=system_prompt,
         )
 
@@ -74,18 +133,12 @@ class AgentFactory:
         """Create independent data catalog agent"""
         from utils.datacatalog_tools import DATACATALOG_TOOLS
 
-        if self.current_language == "en":
-            system_prompt = DATACATALOG_AGENT_PROMPT_EN
-        else:
-            system_prompt = DATACATALOG_AGENT_PROMPT_ZH
+        system_prompt = self.get_system_prompt("datacatalog")
 
         # Create Agent
         agent = Agent(
-            tools=DATACATALOG_TOOLS,
-            model=BedrockModel(
-                model_id=settings.get("BEDROCK_MODEL_ID"),
-                max_tokens=settings.get("BEDROCK_MAX_TOKENS", 4000),
-            ),
+            tools=list(DATACATALOG_TOOLS),
+            model=self.create_model(),
             system_prompt=system_prompt,
         )
 
@@ -94,23 +147,17 @@ class AgentFactory:
     def create_lineage_agent(self) -> Agent:
         """Create independent lineage agent"""
         # Get MCP tools (using shared MCP client)
-        mcp_tools = self.mcp_client.list_tools_sync()
+        mcp_tools = self.get_mcp_tools()
 
         # Merge MCP tools and time tools
         all_tools = mcp_tools + TIME_TOOLS
 
-        if self.current_language == "en":
-            system_prompt = LINEAGE_AGENT_PROMPT_EN
-        else:
-            system_prompt = LINEAGE_AGENT_PROMPT_ZH
+        system_prompt = self.get_system_prompt("lineage")
 
         # Create Agent
         agent = Agent(
             tools=all_tools,
-            model=BedrockModel(
-                model_id=settings.get("BEDROCK_MODEL_ID"),
-                max_tokens=settings.get("BEDROCK_MAX_TOKENS", 4000),
-            ),
+            model=self.create_model(),
             system_prompt=system_prompt,
         )
 
@@ -119,17 +166,11 @@ class AgentFactory:
     def create_specialist_agent(self) -> Agent:
         """Create independent specialist agent"""
 
-        if self.current_language == "en":
-            system_prompt = SPECIALIST_AGENT_PROMPT_EN
-        else:
-            system_prompt = SPECIALIST_AGENT_PROMPT_ZH
+        system_prompt = self.get_system_prompt("specialist")
 
         return Agent(
             tools=TIME_TOOLS,
-            model=BedrockModel(
-                model_id=settings.get("BEDROCK_MODEL_ID"),
-                max_tokens=settings.get("BEDROCK_MAX_TOKENS", 4000),
-            ),
+            model=self.create_model(),
             system_prompt=system_prompt,
         )
 
@@ -137,7 +178,7 @@ class AgentFactory:
         """Create independent orchestrator agent"""
 
         @tool
-        def call_metadata_agent(query: str) -> str:
+        async def call_metadata_agent(query: str) -> str:
             """Call metadata agent"""
             try:
                 # Update interface status (only in Streamlit environment)
@@ -145,13 +186,13 @@ class AgentFactory:
                     "metadata", "Metadata agent is processing query..."
                 )
 
-                result = agents_dict["metadata"](query)
+                result = await agents_dict["metadata"].invoke_async(query)
                 return f"Metadata agent reply:\n{result}"
             except Exception as e:
                 return f"Failed to call metadata agent: {str(e)}"
 
         @tool
-        def call_lineage_agent(query: str) -> str:
+        async def call_lineage_agent(query: str) -> str:
             """Call lineage agent"""
             try:
                 # Update interface status (only in Streamlit environment)
@@ -159,13 +200,13 @@ class AgentFactory:
                     "lineage", "Lineage agent is analyzing data lineage..."
                 )
 
-                result = agents_dict["lineage"](query)
+                result = await agents_dict["lineage"].invoke_async(query)
                 return f"Lineage agent reply:\n{result}"
             except Exception as e:
                 return f"Failed to call lineage agent: {str(e)}"
 
         @tool
-        def call_specialist_agent(query: str) -> str:
+        async def call_specialist_agent(query: str) -> str:
             """Call specialist agent"""
             try:
                 # Update interface status (only in Streamlit environment)
@@ -173,13 +214,13 @@ class AgentFactory:
                     "specialist", "Specialist agent is generating analysis report..."
                 )
 
-                result = agents_dict["specialist"](query)
+                result = await agents_dict["specialist"].invoke_async(query)
                 return f"Specialist agent reply:\n{result}"
             except Exception as e:
                 return f"Failed to call specialist agent: {str(e)}"
 
         @tool
-        def call_datacatalog_agent(query: str) -> str:
+        async def call_datacatalog_agent(query: str) -> str:
             """Call data catalog agent"""
             try:
                 # Update interface status (only in Streamlit environment)
@@ -187,15 +228,43 @@ class AgentFactory:
                     "datacatalog", "Data catalog agent is querying data catalog..."
                 )
 
-                result = agents_dict["datacatalog"](query)
+                result = await agents_dict["datacatalog"].invoke_async(query)
                 return f"Data catalog agent reply:\n{result}"
             except Exception as e:
                 return f"Failed to call data catalog agent: {str(e)}"
 
-        if self.current_language == "en":
-            system_prompt = ORCHESTRATOR_AGENT_PROMPT_EN
-        else:
-            system_prompt = ORCHESTRATOR_AGENT_PROMPT_ZH
+        @tool
+        async def call_agents_in_parallel(queries: dict[str, str]) -> str:
+            """Call several specialized agents concurrently
+
+            Args:
+                queries: Mapping of agent name (metadata, lineage, datacatalog,
+                    specialist) to the query sent to that agent
+            """
+            unknown_agents = [
+                name
+                for name in queries
+                if name == "orchestrator" or name not in agents_dict
+            ]
+            if unknown_agents:
+                return f"Unknown agents: {', '.join(unknown_agents)}"
+
+            async def query_agent(agent_name: str, query: str) -> str:
+                StreamlitContext.update_agent_status(
+                    agent_name, f"{agent_name} agent is processing query..."
+                )
+                try:
+                    result = await agents_dict[agent_name].invoke_async(query)
+                    return f"{agent_name} agent reply:\n{result}"
+                except Exception as e:
+                    return f"Failed to call {agent_name} agent: {str(e)}"
+
+            replies = await asyncio.gather(
+                *(query_agent(name, query) for name, query in queries.items())
+            )
+            return "\n\n".join(replies)
+
+        system_prompt = self.get_system_prompt("orchestrator")
 
         return Agent(
             tools=[
@@ -203,10 +272,8 @@ class AgentFactory:
                 call_lineage_agent,
                 call_specialist_agent,
                 call_datacatalog_agent,
+                call_agents_in_parallel,
             ],
-            model=BedrockModel(
-                model_id=settings.get("BEDROCK_MODEL_ID"),
-                max_tokens=settings.get("BEDROCK_MAX_TOKENS", 4000),
-            ),
+            model=self.create_model(),
             system_prompt=system_prompt,
         )
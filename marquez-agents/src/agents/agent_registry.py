@@ -0,0 +1,41 @@
+"""
+Agent Registry - Lazily creates Agent instances on first use
+"""
+
+import threading
+from collections.abc import Callable, Iterator, Mapping
+
+from strands import Agent
+
+
+class LazyAgentRegistry(Mapping):
+    """Read-only agent mapping that builds each agent the first time it is used"""
+
+    def __init__(self, builders: dict[str, Callable[[], Agent]]):
+        self._builders = builders
+        self._agents: dict[str, Agent] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, agent_name: str) -> Agent:
+        agent = self._agents.get(agent_name)
+        if agent is not None:
+            return agent
+
+        with self._lock:
+            if agent_name not in self._agents:
+                self._agents[agent_name] = self._builders[agent_name]()
+            return self._agents[agent_name]
+
+    def __contains__(self, agent_name: object) -> bool:
+        # Membership must not build the agent
+        return agent_name in self._builders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def created_agents(self) -> dict[str, Agent]:
+        """Get agents that have already been built"""
+        return dict(self._agents)
@@ -2,6 +2,7 @@
 Dynaconf Configuration Module
 """
 
+import functools
 from pathlib import Path
 
 from dynaconf import Dynaconf
@@ -10,16 +11,30 @@ from dynaconf import Dynaconf
 project_root = Path(__file__).parent.parent
 config_dir = project_root / "config"
 
-# Initialize dynaconf settings
-settings = Dynaconf(
-    envvar_prefix="DYNACONF",
-    settings_files=[
-        str(config_dir / "settings.toml"),
-        str(config_dir / "settings.local.toml"),
-        str(config_dir / "settings.development.toml"),
-        str(config_dir / ".secrets.toml"),
-    ],
-    environments=True,
-    load_dotenv=True,
-    env_switcher="ENV_FOR_DYNACONF",
+# Settings files in override order, missing ones (e.g. .secrets.toml) are skipped
+SETTINGS_FILES = (
+    "settings.toml",
+    "settings.local.toml",
+    "settings.development.toml",
+    ".secrets.toml",
 )
+
+
+@functools.cache
+def get_settings() -> Dynaconf:
+    """Build dynaconf settings once per process"""
+    return Dynaconf(
+        envvar_prefix="DYNACONF",
+        settings_files=[
+            str(config_dir / name)
+            for name in SETTINGS_FILES
+            if (config_dir / name).exists()
+        ],
+        environments=True,
+        load_dotenv=True,
+        env_switcher="ENV_FOR_DYNACONF",
+    )
+
+
+# Initialize dynaconf settings
+settings = get_settings()
@@ -3,32 +3,66 @@ AWS Strands True Multi-Agent System Core Class
 True multi-agent architecture implementation
 """
 
+import atexit
+import contextlib
+
 from agents.agent_factory import AgentFactory
-from config import settings
+from agents.agent_registry import LazyAgentRegistry
+from config import get_settings
 from mcp.client.streamable_http import streamablehttp_client
 from strands.tools.mcp.mcp_client import MCPClient
 from ui.interface_manager import InterfaceManager
 from utils.warning_suppressor import WarningSupressor
 
+# CLI system commands, keyed by lowercased user input
+CLI_COMMANDS = {
+    "quit": "quit",
+    "exit": "quit",
+    "退出": "quit",
+    "help": "help",
+    "帮助": "help",
+    "agents": "agents",
+    "代理": "agents",
+}
+
 
 class TrueMultiAgentSystem:
     """True multi-agent system"""
 
+    __slots__ = (
+        "agents",
+        "agent_names",
+        "mcp_client",
+        "factory",
+        "use_cli_interface",
+        "current_language",
+        "interface",
+        "_exit_stack",
+    )
+
     def __init__(self, use_cli_interface=True, language="zh"):
         # Suppress Streamlit warnings (if not in Streamlit environment)
         if not use_cli_interface:
             WarningSupressor.suppress_streamlit_warnings()
 
         self.agents = {}
+        self.agent_names = ()
         self.mcp_client = None
+        self.factory = None
         self.use_cli_interface = use_cli_interface
         self.current_language = language
+        self._exit_stack = contextlib.ExitStack()
 
         if use_cli_interface:
             self.interface = InterfaceManager()
 
-        self._initialize_mcp_client()
-        self._initialize_agents()
+        try:
+            self._initialize_mcp_client()
+            self._initialize_agents()
+        except Exception:
+            # Release the MCP session if agents could not be created
+            self.cleanup()
+            raise
 
         if use_cli_interface:
             print("🚀 Agentic Lineage For Lakehouse started")
@@ -37,40 +71,48 @@ class TrueMultiAgentSystem:
 
     def _initialize_mcp_client(self):
         """Initialize MCP client"""
-        self.mcp_client = MCPClient(
-            lambda: streamablehttp_client(settings.MARQUEZ_MCP_URL)
+        # Start MCP client connection, closed together with the exit stack
+        self.mcp_client = self._exit_stack.enter_context(
+            MCPClient(lambda: streamablehttp_client(get_settings().MARQUEZ_MCP_URL))
         )
-        # Start MCP client connection
-        self.mcp_client.__enter__()
+        # Release the MCP session even if the process exits without cleanup()
+        atexit.register(self.cleanup)
 
     def _initialize_agents(self):
-        """Initialize all independent Agent instances"""
+        """Register all independent Agent instances, built on first use"""
         factory = AgentFactory(self.mcp_client)
         factory.set_language(self.current_language)
+        self.factory = factory
+
+        # Orchestrator tools reference the registry, so sub-agents are only
+        # created when the orchestrator (or the user) first routes to them
+        self.agents = LazyAgentRegistry(
+            {
+                "metadata": factory.create_metadata_agent,
+                "lineage": factory.create_lineage_agent,
+                "specialist": factory.create_specialist_agent,
+                "datacatalog": factory.create_datacatalog_agent,
+                "orchestrator": lambda: factory.create_orchestrator_agent(self.agents),
+            }
+        )
 
-        # 1. Create specialized agents
-        metadata_agent = factory.create_metadata_agent()
-        lineage_agent = factory.create_lineage_agent()
-        specialist_agent = factory.create_specialist_agent()
-        datacatalog_agent = factory.create_datacatalog_agent()
-
-        # 2. Create agent dictionary (orchestrator needs to reference other agents)
-        self.agents = {
-            "metadata": metadata_agent,
-            "lineage": lineage_agent,
-            "specialist": specialist_agent,
-            "datacatalog": datacatalog_agent,
-        }
+        # The set of agent names is fixed once the registry is built
+        self.agent_names = tuple(self.agents)
 
-        # 3. Create orchestrator agent (needs access to other agents)
-        orchestrator_agent = factory.create_orchestrator_agent(self.agents)
-        self.agents["orchestrator"] = orchestrator_agent
+        # Build the default agent up front so startup errors surface early
+        self.agents["orchestrator"]
 
     def set_language(self, language: str):
-        """Set language and reinitialize agents"""
+        """Set language and update agent prompts in place"""
         if language != self.current_language:
             self.current_language = language
-            self._initialize_agents()  # Recreate agents to use new language
+            self.factory.set_language(language)
+
+            # Agents, MCP tool bindings and orchestrator references stay valid,
+            # only the system prompt depends on the language
+            # Agents not built yet will pick up the new language on creation
+            for agent_name, agent in self.agents.created_agents().items():
+                agent.system_prompt = self.factory.get_system_prompt(agent_name)
 
     def run(self):
         """Run interactive system (CLI mode only)"""
@@ -88,26 +130,29 @@ class TrueMultiAgentSystem:
                     continue
 
                 # Handle system commands
-                if user_input.lower() in ["quit", "exit", "退出"]:
+                lowered_input = user_input.lower()
+                command = CLI_COMMANDS.get(lowered_input)
+
+                if command == "quit":
                     self.interface.show_goodbye()
                     break
 
-                elif user_input.lower() in ["help", "帮助"]:
+                elif command == "help":
                     self.interface.show_help()
                     continue
 
-                elif user_input.lower() in ["agents", "代理"]:
+                elif command == "agents":
                     self.interface.show_agents_status(self.agents)
                     continue
 
-                elif user_input.lower().startswith("switch "):
+                elif lowered_input.startswith("switch "):
                     agent_name_input = user_input[7:].strip()
                     if agent_name_input in self.agents:
                         current_agent = agent_name_input
                         self.interface.show_switch_success(agent_name_input)
                     else:
                         self.interface.show_switch_error(
-                            agent_name_input, list(self.agents.keys())
+                            agent_name_input, self.agent_names
                         )
                     continue
 
@@ -144,8 +189,8 @@ class TrueMultiAgentSystem:
 
     def cleanup(self):
         """Clean up resources"""
-        if self.mcp_client:
-            try:
-                self.mcp_client.__exit__(None, None, None)
-            except Exception:
-                pass
+        atexit.unregister(self.cleanup)
+        try:
+            self._exit_stack.close()
+        except Exception:
+            pass
@@ -2,10 +2,46 @@
 Translator module for internationalization
 """
 
-import json
-import os
+import functools
+import sys
+from pathlib import Path
 
-import streamlit as st
+import orjson
+
+try:
+    from utils.language_manager import LanguageManager
+except ImportError:
+    LanguageManager = None
+
+DEFAULT_LANGUAGE = "zh"  # Default to Chinese
+TRANSLATIONS_DIR = Path(__file__).parent / "translations"
+
+
+@functools.lru_cache(maxsize=8)
+def _load_translation_file(language: str) -> dict:
+    """Load and parse translation file once per language"""
+    try:
+        return orjson.loads((TRANSLATIONS_DIR / f"{language}.json").read_bytes())
+    except FileNotFoundError:
+        # If translation file doesn't exist, use default empty translations
+        return {}
+
+
+def _flatten(translations: dict, prefix: str = "") -> dict[str, str]:
+    """Flatten nested translations into dotted keys (e.g. ui.header.title)"""
+    flat = {}
+    for k, value in translations.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{k}."))
+        elif isinstance(value, str):
+            flat[f"{prefix}{k}"] = value
+    return flat
+
+
+@functools.lru_cache(maxsize=8)
+def _load_flat_translations(language: str) -> dict[str, str]:
+    """Load translations of a language flattened for single-lookup access"""
+    return _flatten(_load_translation_file(language))
 
 
 class Translator:
@@ -14,19 +50,13 @@ class Translator:
     def __init__(self, language: str = "zh"):
         self.language = language
         self.translations = {}
+        self.flat_translations = {}
         self.load_translations()
 
     def load_translations(self):
         """Load translation files"""
-        translations_dir = os.path.join(os.path.dirname(__file__), "translations")
-        translation_file = os.path.join(translations_dir, f"{self.language}.json")
-
-        if os.path.exists(translation_file):
-            with open(translation_file, encoding="utf-8") as f:
-                self.translations = json.load(f)
-        else:
-            # If translation file doesn't exist, use default empty translations
-            self.translations = {}
+        self.translations = _load_translation_file(self.language)
+        self.flat_translations = _load_flat_translations(self.language)
 
     def t(self, key: str, **kwargs) -> str:
         """
@@ -37,56 +67,84 @@ class Translator:
         Returns:
             Translated text
         """
-        # Support nested keys like "ui.header.title"
-        keys = key.split(".")
-        value = self.translations
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                # If translation not found, return the key itself
-                return key
-
-        if isinstance(value, str):
-            try:
-                return value.format(**kwargs)
-            except (KeyError, ValueError):
-                return value
-        else:
+        # Nested keys like "ui.header.title" are flattened at load time
+        value = self.flat_translations.get(key)
+        if value is None:
+            # If translation not found, return the key itself
             return key
 
+        if not kwargs:
+            return value
+
+        try:
+            return value.format(**kwargs)
+        except (KeyError, ValueError):
+            return value
+
     def set_language(self, language: str):
         """Set language"""
         self.language = language
         self.load_translations()
 
 
-# Global translator instance
-_translator = None
+# Translator instances, one per language
+_translators: dict[str, Translator] = {}
 
 
-def get_translator() -> Translator:
-    """Get translator instance"""
-    global _translator
+def _get_session_state():
+    """Get Streamlit session state without importing Streamlit"""
+    # Streamlit is only loaded by the web app, CLI mode never pays for importing it
+    st = sys.modules.get("streamlit")
+    if st is None:
+        return None
+    return getattr(st, "session_state", None)
+
+
+@functools.cache
+def _get_language_manager():
+    """Get the language manager shared by all translations"""
+    return LanguageManager()
+
+
+def _get_saved_language() -> str:
+    """Get language setting saved by the language manager"""
+    if LanguageManager is not None:
+        return _get_language_manager().get_language()
+    return DEFAULT_LANGUAGE
+
+
+def _resolve_language_getter():
+    """Pick where the current language comes from, fixed for the process"""
+    session_state = _get_session_state()
+    if session_state is None:
+        return _get_saved_language
 
     # Get language setting from Streamlit session state
-    if hasattr(st, "session_state") and "language" in st.session_state:
-        language = st.session_state.language
-    else:
-        # Try to get from language manager
-        try:
-            from utils.language_manager import LanguageManager
+    return lambda: session_state.get("language") or _get_saved_language()
+
 
-            language_manager = LanguageManager()
-            language = language_manager.get_language()
-        except ImportError:
-            language = "zh"  # Default to Chinese
+# Resolved on first use by _get_current_language
+_language_getter = None
+
+
+def _get_current_language() -> str:
+    """Get current language setting"""
+    global _language_getter
+
+    if _language_getter is None:
+        _language_getter = _resolve_language_getter()
+    return _language_getter()
+
+
+def get_translator() -> Translator:
+    """Get translator instance"""
+    language = _get_current_language()
 
-    if _translator is None or _translator.language != language:
-        _translator = Translator(language)
+    translator = _translators.get(language)
+    if translator is None:
+        translator = _translators.setdefault(language, Translator(language))
 
-    return _translator
+    return translator
 
 
 def t(key: str, **kwargs) -> str:
@@ -5,13 +5,12 @@ AWS Strands True Multi-Agent System Main Entry
 import os
 import sys
 
-from core.multi_agent_system import TrueMultiAgentSystem
-from i18n import t
-from utils.config_validator import ConfigValidator
-
 # Add necessary paths
 sys.path.insert(0, os.path.dirname(__file__))
 
+from i18n import t  # noqa: E402
+from utils.config_validator import ConfigValidator  # noqa: E402
+
 
 def main():
     """Main function"""
@@ -21,6 +20,9 @@ def main():
         if not is_valid:
             return
 
+        # Import the agent stack (MCP + Strands) only once configuration is valid
+        from core.multi_agent_system import TrueMultiAgentSystem
+
         # Start system
         system = TrueMultiAgentSystem()
         system.run()
@@ -3,12 +3,121 @@ AWS Strands Multi-Agent System V2
 True multi-agent architecture implementation
 """
 
-import boto3
+import atexit
+import contextlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from config import settings
 from mcp.client.streamable_http import streamablehttp_client
-from strands import Agent
+from strands import Agent, tool
 from strands.models import BedrockModel
 from strands.tools.mcp.mcp_client import MCPClient
+from utils.aws import get_glue_client
+from utils.ttl_cache import ttl_cache
+
+# 与提示词中"明细超过500"的限制保持一致
+MAX_GLUE_DATABASES = 500
+
+
+@ttl_cache(ttl_seconds=60, maxsize=4)
+def list_glue_databases(region: str) -> list[str]:
+    """获取Glue数据库名称（缓存60秒，最多返回MAX_GLUE_DATABASES + 1个）"""
+    paginator = get_glue_client(region).get_paginator("get_databases")
+    pages = paginator.paginate(
+        PaginationConfig={"MaxItems": MAX_GLUE_DATABASES + 1, "PageSize": 100}
+    )
+    return [db["Name"] for page in pages for db in page["DatabaseList"]]
+
+
+# 代理显示名称
+AGENT_DISPLAY_NAMES = {
+    "orchestrator": "协调器",
+    "metadata": "元数据",
+    "lineage": "血缘",
+    "specialist": "专家",
+}
+
+# 代理状态描述
+AGENT_DESCRIPTIONS = {
+    "orchestrator": "协调器代理 - 独立Agent实例，管理代理协作",
+    "metadata": "元数据代理 - 独立Agent实例，带MCP工具",
+    "lineage": "血缘代理 - 独立Agent实例，带MCP工具",
+    "specialist": "专家代理 - 独立Agent实例，带分析工具",
+}
+
+
+# 可由协调器调用的专业代理
+SUB_AGENT_NAMES = frozenset({"metadata", "lineage", "specialist"})
+
+# 系统命令（匹配小写输入）
+QUIT_COMMANDS = frozenset({"quit", "exit", "退出"})
+HELP_COMMANDS = frozenset({"help", "帮助"})
+AGENTS_COMMANDS = frozenset({"agents", "代理"})
+
+# 启动欢迎信息
+WELCOME_MESSAGE = """
+欢迎使用 AWS Strands True Multi-Agent System！
+
+这是一个真正的多代理架构，每个代理都是独立的Agent实例：
+
+🎯 Orchestrator Agent - 协调器代理（默认）
+📊 Metadata Agent - 元数据代理（带MCP工具）
+📈 Lineage Agent - 血缘代理（带MCP工具）
+🔍 Specialist Agent - 专家代理（带分析工具）
+
+功能示例：
+• 查询命名空间：marquez有多少命名空间？
+• 查询字段血缘：请查询字段 user_id 的血缘来源
+• 影响分析：分析字段变更的影响
+• 生成报告：生成血缘健康报告
+
+命令：
+- 'help' 或 '帮助' - 显示帮助信息
+- 'agents' 或 '代理' - 显示所有代理状态
+- 'switch <agent>' - 切换到指定代理
+- 'quit' 或 'exit' - 退出系统
+
+直接输入问题即可开始对话！
+"""
+
+# 帮助信息
+HELP_MESSAGE = """
+📚 AWS Strands True Multi-Agent System 帮助
+
+这是一个真正的多代理架构，每个代理都是独立的Agent实例：
+
+🎯 协调器代理 (Orchestrator Agent)：
+   - 自动路由请求到合适的专业代理
+   - 协调多代理协作
+   - 系统状态检查
+
+📊 元数据代理 (Metadata Agent)：
+   - 统计资产和作业数量（通过MCP工具）
+   - 查询Marquez命名空间
+   - 获取AWS Glue数据目录
+
+📈 血缘代理 (Lineage Agent)：
+   - 查询字段血缘来源（通过MCP工具）
+   - 分析字段变更影响
+   - 生成血缘关系图
+
+🔍 专家代理 (Specialist Agent)：
+   - 生成血缘健康报告
+   - 分析数据质量问题
+   - 提供治理建议
+
+💡 架构特点：
+   - 每个代理都是独立的Agent实例
+   - 代理间通过工具调用进行通信
+   - 真正的多代理协作模式
+
+🔧 系统命令：
+   - help/帮助: 显示此帮助信息
+   - agents/代理: 查看所有代理状态
+   - switch <agent>: 切换代理
+   - quit/exit/退出: 退出系统
+"""
 
 
 class TrueMultiAgentSystem:
@@ -16,7 +125,11 @@ class TrueMultiAgentSystem:
 
     def __init__(self):
         self.agents = {}
+        self._agent_names = frozenset()
+        self._agent_names_csv = ""
         self.mcp_client = None
+        self._mcp_tools = []
+        self._exit_stack = contextlib.ExitStack()
         self._initialize_mcp_client()
         self._initialize_agents()
 
@@ -26,11 +139,14 @@ class TrueMultiAgentSystem:
 
     def _initialize_mcp_client(self):
         """Initialize MCP client"""
-        self.mcp_client = MCPClient(
-            lambda: streamablehttp_client(settings.MARQUEZ_MCP_URL)
+        # Start MCP client connection, closed together with the exit stack
+        self.mcp_client = self._exit_stack.enter_context(
+            MCPClient(lambda: streamablehttp_client(settings.MARQUEZ_MCP_URL))
         )
-        # Start MCP client connection
-        self.mcp_client.__enter__()
+        # 进程异常退出时也释放MCP会话
+        atexit.register(self.cleanup)
+        # 工具列表在会话内不变，只获取一次
+        self._mcp_tools = self.mcp_client.list_tools_sync()
 
     def _initialize_agents(self):
         """Initialize all independent Agent instances"""
@@ -53,24 +169,28 @@ class TrueMultiAgentSystem:
             "lineage": lineage_agent,
             "specialist": specialist_agent,
         }
+        # 代理集合初始化后不变，供switch命令校验和提示
+        self._agent_names = frozenset(self.agents)
+        self._agent_names_csv = ", ".join(self.agents)
 
     def _create_metadata_agent(self) -> Agent:
         """创建独立的元数据代理"""
         # 获取MCP工具（使用共享的MCP客户端）
-        mcp_tools = self.mcp_client.list_tools_sync()
+        mcp_tools = self._mcp_tools
 
         # 添加AWS Glue工具
-        from strands import tool
-
         @tool
         def get_glue_databases() -> str:
             """获取AWS Glue数据库列表"""
             try:
-                glue_client = boto3.client(
-                    "glue", region_name=settings.get("bedrock.region", "us-west-2")
+                databases = list_glue_databases(
+                    settings.get("bedrock.region", "us-west-2")
                 )
-                response = glue_client.get_databases()
-                databases = [db["Name"] for db in response["DatabaseList"]]
+                if len(databases) > MAX_GLUE_DATABASES:
+                    return (
+                        f"AWS Glue数据库（超过{MAX_GLUE_DATABASES}个，仅显示前"
+                        f"{MAX_GLUE_DATABASES}个）: {databases[:MAX_GLUE_DATABASES]}"
+                    )
                 return f"AWS Glue数据库: {databases}"
             except Exception as e:
                 return f"获取Glue数据库失败: {str(e)}"
@@ -110,7 +230,7 @@ class TrueMultiAgentSystem:
     def _create_lineage_agent(self) -> Agent:
         """创建独立的血缘代理"""
         # 获取MCP工具（使用共享的MCP客户端）
-        mcp_tools = self.mcp_client.list_tools_sync()
+        mcp_tools = self._mcp_tools
 
         system_prompt = """你是一个数据血缘分析专家，负责查询和分析数据血缘关系。
 
@@ -138,7 +258,6 @@ class TrueMultiAgentSystem:
 
     def _create_specialist_agent(self) -> Agent:
         """创建独立的专家代理"""
-        from strands import tool
 
         @tool
         def generate_health_report() -> str:
@@ -171,7 +290,6 @@ class TrueMultiAgentSystem:
 
     def _create_orchestrator_agent(self) -> Agent:
         """创建独立的协调器代理"""
-        from strands import tool
 
         @tool
         def call_metadata_agent(query: str) -> str:
@@ -200,6 +318,34 @@ class TrueMultiAgentSystem:
             except Exception as e:
                 return f"调用专家代理失败：{str(e)}"
 
+        @tool
+        def call_agents(tasks: list[dict]) -> str:
+            """并行调用多个专业代理
+
+            Args:
+                tasks: 任务列表，每项为 {"agent": 代理名称, "query": 问题}，
+                    代理名称为 metadata、lineage 或 specialist
+            """
+
+            def run_task(task: dict) -> str:
+                agent_name = task.get("agent")
+                if agent_name not in SUB_AGENT_NAMES:
+                    return f"未找到代理: {agent_name}"
+                try:
+                    result = self.agents[agent_name](task.get("query", ""))
+                    return f"{agent_name}代理回复：\n{result}"
+                except Exception as e:
+                    return f"调用{agent_name}代理失败：{str(e)}"
+
+            if not tasks:
+                return "没有需要执行的任务"
+            # 同一个代理实例不能并发调用
+            if len({task.get("agent") for task in tasks}) < len(tasks):
+                return "每个代理只能提交一个任务，请合并同一代理的问题"
+
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                return "\n\n".join(executor.map(run_task, tasks))
+
         system_prompt = """你是一个协调器，负责管理多个专业代理的协作。
 
 你的职责包括：
@@ -214,11 +360,17 @@ class TrueMultiAgentSystem:
 - 专家代理：生成报告和提供专业建议
 
 请根据用户的问题类型，选择合适的代理来处理请求。
+当需要多个代理分别处理相互独立的问题时，一次性调用 call_agents 批量提交所有任务，不要逐个调用。
 
 用中文回复用户。"""
 
         return Agent(
-            tools=[call_metadata_agent, call_lineage_agent, call_specialist_agent],
+            tools=[
+                call_metadata_agent,
+                call_lineage_agent,
+                call_specialist_agent,
+                call_agents,
+            ],
             model=BedrockModel(
                 model_id=settings.get("BEDROCK_MODEL_ID"),
                 max_tokens=settings.get("BEDROCK_MAX_TOKENS", 4000),
@@ -228,31 +380,7 @@ class TrueMultiAgentSystem:
 
     def _show_welcome_message(self):
         """显示欢迎信息"""
-        welcome_msg = """
-欢迎使用 AWS Strands True Multi-Agent System！
-
-这是一个真正的多代理架构，每个代理都是独立的Agent实例：
-
-🎯 Orchestrator Agent - 协调器代理（默认）
-📊 Metadata Agent - 元数据代理（带MCP工具）
-📈 Lineage Agent - 血缘代理（带MCP工具）
-🔍 Specialist Agent - 专家代理（带分析工具）
-
-功能示例：
-• 查询命名空间：marquez有多少命名空间？
-• 查询字段血缘：请查询字段 user_id 的血缘来源
-• 影响分析：分析字段变更的影响
-• 生成报告：生成血缘健康报告
-
-命令：
-- 'help' 或 '帮助' - 显示帮助信息
-- 'agents' 或 '代理' - 显示所有代理状态
-- 'switch <agent>' - 切换到指定代理
-- 'quit' 或 'exit' - 退出系统
-
-直接输入问题即可开始对话！
-"""
-        print(welcome_msg)
+        print(WELCOME_MESSAGE)
 
     def run(self):
         """运行交互式系统"""
@@ -260,12 +388,7 @@ class TrueMultiAgentSystem:
 
         while True:
             try:
-                agent_name = {
-                    "orchestrator": "协调器",
-                    "metadata": "元数据",
-                    "lineage": "血缘",
-                    "specialist": "专家",
-                }.get(current_agent, current_agent)
+                agent_name = AGENT_DISPLAY_NAMES.get(current_agent, current_agent)
 
                 user_input = input(f"\n[{agent_name}代理] 请输入您的问题: ").strip()
 
@@ -273,26 +396,28 @@ class TrueMultiAgentSystem:
                     continue
 
                 # 处理系统命令
-                if user_input.lower() in ["quit", "exit", "退出"]:
+                command = user_input.lower()
+
+                if command in QUIT_COMMANDS:
                     print("👋 感谢使用 AWS Strands True Multi-Agent System！")
                     break
 
-                elif user_input.lower() in ["help", "帮助"]:
+                elif command in HELP_COMMANDS:
                     self._show_help()
                     continue
 
-                elif user_input.lower() in ["agents", "代理"]:
+                elif command in AGENTS_COMMANDS:
                     self._show_agents_status()
                     continue
 
-                elif user_input.lower().startswith("switch "):
+                elif command.startswith("switch "):
                     agent_name_input = user_input[7:].strip()
-                    if agent_name_input in self.agents:
+                    if agent_name_input in self._agent_names:
                         current_agent = agent_name_input
                         print(f"✅ 已切换到 {agent_name_input} 代理")
                     else:
                         print(f"❌ 未找到代理: {agent_name_input}")
-                        print(f"可用代理: {', '.join(self.agents.keys())}")
+                        print(f"可用代理: {self._agent_names_csv}")
                     continue
 
                 # 处理用户问题
@@ -300,10 +425,10 @@ class TrueMultiAgentSystem:
 
                 try:
                     response = self.agents[current_agent](user_input)
-                    print(f"\n💡 {agent_name}代理回复：")
-                    print("-" * 50)
-                    print(response)
-                    print("-" * 50)
+                    sys.stdout.write(
+                        f"\n💡 {agent_name}代理回复：\n{'-' * 50}\n{response}\n{'-' * 50}\n"
+                    )
+                    sys.stdout.flush()
 
                 except Exception as e:
                     print(f"\n❌ 处理请求时出错: {str(e)}")
@@ -321,73 +446,27 @@ class TrueMultiAgentSystem:
 
     def _show_help(self):
         """显示帮助信息"""
-        help_msg = """
-📚 AWS Strands True Multi-Agent System 帮助
-
-这是一个真正的多代理架构，每个代理都是独立的Agent实例：
-
-🎯 协调器代理 (Orchestrator Agent)：
-   - 自动路由请求到合适的专业代理
-   - 协调多代理协作
-   - 系统状态检查
-
-📊 元数据代理 (Metadata Agent)：
-   - 统计资产和作业数量（通过MCP工具）
-   - 查询Marquez命名空间
-   - 获取AWS Glue数据目录
-
-📈 血缘代理 (Lineage Agent)：
-   - 查询字段血缘来源（通过MCP工具）
-   - 分析字段变更影响
-   - 生成血缘关系图
-
-🔍 专家代理 (Specialist Agent)：
-   - 生成血缘健康报告
-   - 分析数据质量问题
-   - 提供治理建议
-
-💡 架构特点：
-   - 每个代理都是独立的Agent实例
-   - 代理间通过工具调用进行通信
-   - 真正的多代理协作模式
-
-🔧 系统命令：
-   - help/帮助: 显示此帮助信息
-   - agents/代理: 查看所有代理状态
-   - switch <agent>: 切换代理
-   - quit/exit/退出: 退出系统
-"""
-        print(help_msg)
+        print(HELP_MESSAGE)
 
     def _show_agents_status(self):
         """显示所有代理状态"""
-        print("\n🤖 代理状态检查:")
-        print("=" * 40)
-
-        for agent_name, _agent in self.agents.items():
-            try:
-                status = "✅ 正常"
-                description = {
-                    "orchestrator": "协调器代理 - 独立Agent实例，管理代理协作",
-                    "metadata": "元数据代理 - 独立Agent实例，带MCP工具",
-                    "lineage": "血缘代理 - 独立Agent实例，带MCP工具",
-                    "specialist": "专家代理 - 独立Agent实例，带分析工具",
-                }.get(agent_name, "未知代理")
-
-                print(f"{status} {agent_name}: {description}")
+        lines = ["\n🤖 代理状态检查:", "=" * 40]
 
-            except Exception as e:
-                print(f"❌ {agent_name}: 状态异常 - {str(e)}")
+        for agent_name in self.agents:
+            description = AGENT_DESCRIPTIONS.get(agent_name, "未知代理")
+            lines.append(f"✅ 正常 {agent_name}: {description}")
 
-        print("=" * 40)
+        lines.append("=" * 40)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def cleanup(self):
         """清理资源"""
-        if self.mcp_client:
-            try:
-                self.mcp_client.__exit__(None, None, None)
-            except Exception:
-                pass
+        atexit.unregister(self.cleanup)
+        try:
+            self._exit_stack.close()
+        except Exception:
+            pass
 
 
 def main():
@@ -2,15 +2,36 @@
 User Interface Manager Class - Responsible for handling user interaction and displaying information
 """
 
+import os
+import sys
+from collections.abc import Iterable
 from typing import Any
 
-
-class InterfaceManager:
-    """User Interface Manager Class"""
-
-    def show_welcome_message(self):
-        """Show welcome message"""
-        welcome_msg = """
+from prompt_toolkit import PromptSession
+from prompt_toolkit.history import FileHistory
+
+# Input history persisted across CLI sessions
+HISTORY_FILE = os.path.expanduser("~/.marquez_agents_history")
+
+# Agent display names shown in prompts and messages
+AGENT_DISPLAY_NAMES = {
+    "orchestrator": "协调器",
+    "metadata": "元数据",
+    "lineage": "血缘",
+    "datacatalog": "数据目录",
+    "specialist": "专家",
+}
+
+# Agent descriptions shown in the status check
+AGENT_DESCRIPTIONS = {
+    "orchestrator": "协调器代理 - 独立Agent实例，管理代理协作",
+    "metadata": "元数据代理 - 独立Agent实例，带MCP工具",
+    "lineage": "血缘代理 - 独立Agent实例，带MCP工具",
+    "specialist": "专家代理 - 独立Agent实例，带分析工具",
+}
+
+# Welcome message shown at CLI startup
+WELCOME_MESSAGE = """
 欢迎使用 Agentic Lineage For Lakehouse！
 
 这是一个智能数据血缘分析系统，采用多代理架构：
@@ -36,11 +57,9 @@ class InterfaceManager:
 
 直接输入问题即可开始对话！
 """
-        print(welcome_msg)
 
-    def show_help(self):
-        """Show help information"""
-        help_msg = """
+# Help text shown by the help command
+HELP_MESSAGE = """
 📚 Agentic Lineage For Lakehouse 帮助
 
 这是一个智能数据血缘分析系统，采用多代理架构：
@@ -76,39 +95,44 @@ class InterfaceManager:
    - switch <agent>: 切换代理
    - quit/exit/退出: 退出系统
 """
-        print(help_msg)
 
-    def show_agents_status(self, agents: dict[str, Any]):
-        """Show all agents status"""
-        print("\n🤖 代理状态检查:")
-        print("=" * 40)
 
-        for agent_name, _agent in agents.items():
-            try:
-                status = "✅ 正常"
-                description = {
-                    "orchestrator": "协调器代理 - 独立Agent实例，管理代理协作",
-                    "metadata": "元数据代理 - 独立Agent实例，带MCP工具",
-                    "lineage": "血缘代理 - 独立Agent实例，带MCP工具",
-                    "specialist": "专家代理 - 独立Agent实例，带分析工具",
-                }.get(agent_name, "未知代理")
+class InterfaceManager:
+    """User Interface Manager Class"""
 
-                print(f"{status} {agent_name}: {description}")
+    __slots__ = ("_session", "_prompts")
+
+    def __init__(self):
+        self._session = None
+        self._prompts = {}
+
+    def show_welcome_message(self):
+        """Show welcome message"""
+        print(WELCOME_MESSAGE)
+
+    def show_help(self):
+        """Show help information"""
+        print(HELP_MESSAGE)
+
+    def _write_lines(self, lines: list[str]):
+        """Write lines to stdout in a single write and flush"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def show_agents_status(self, agents: dict[str, Any]):
+        """Show all agents status"""
+        lines = ["\n🤖 代理状态检查:", "=" * 40]
 
-            except Exception as e:
-                print(f"❌ {agent_name}: 状态异常 - {str(e)}")
+        for agent_name in agents:
+            description = AGENT_DESCRIPTIONS.get(agent_name, "未知代理")
+            lines.append(f"✅ 正常 {agent_name}: {description}")
 
-        print("=" * 40)
+        lines.append("=" * 40)
+        self._write_lines(lines)
 
     def get_agent_display_name(self, agent_key: str) -> str:
         """Get agent display name"""
-        return {
-            "orchestrator": "协调器",
-            "metadata": "元数据",
-            "lineage": "血缘",
-            "datacatalog": "数据目录",
-            "specialist": "专家",
-        }.get(agent_key, agent_key)
+        return AGENT_DISPLAY_NAMES.get(agent_key, agent_key)
 
     def show_thinking(self, agent_name: str):
         """Show agent thinking status"""
@@ -116,20 +140,22 @@ class InterfaceManager:
 
     def show_response(self, agent_name: str, response: str):
         """Show agent response"""
-        print(f"\n💡 {agent_name}代理回复：")
-        print("-" * 50)
-        print(response)
-        print("-" * 50)
+        self._write_lines(
+            [f"\n💡 {agent_name}代理回复：", "-" * 50, str(response), "-" * 50]
+        )
 
     def show_error(self, error_msg: str):
         """Show error message"""
-        print(f"\n❌ 处理请求时出错: {error_msg}")
-        print("请尝试重新表述您的问题或切换到其他代理。")
+        self._write_lines(
+            [
+                f"\n❌ 处理请求时出错: {error_msg}",
+                "请尝试重新表述您的问题或切换到其他代理。",
+            ]
+        )
 
     def show_system_error(self, error_msg: str):
         """Show system error"""
-        print(f"\n❌ 系统错误: {error_msg}")
-        print("系统将继续运行，请重试。")
+        self._write_lines([f"\n❌ 系统错误: {error_msg}", "系统将继续运行，请重试。"])
 
     def show_goodbye(self):
         """Show goodbye message"""
@@ -139,11 +165,19 @@ class InterfaceManager:
         """Show switch success message"""
         print(f"✅ 已切换到 {agent_name} 代理")
 
-    def show_switch_error(self, agent_name: str, available_agents: list):
+    def show_switch_error(self, agent_name: str, available_agents: Iterable[str]):
         """Show switch error message"""
-        print(f"❌ 未找到代理: {agent_name}")
-        print(f"可用代理: {', '.join(available_agents)}")
+        self._write_lines(
+            [f"❌ 未找到代理: {agent_name}", f"可用代理: {', '.join(available_agents)}"]
+        )
 
     def get_user_input(self, agent_name: str) -> str:
         """Get user input"""
-        return input(f"\n[{agent_name}代理] 请输入您的问题: ").strip()
+        if self._session is None:
+            self._session = PromptSession(history=FileHistory(HISTORY_FILE))
+        prompt = self._prompts.get(agent_name)
+        if prompt is None:
+            prompt = self._prompts[agent_name] = (
+                f"\n[{agent_name}代理] 请输入您的问题: "
+            )
+        return self._session.prompt(prompt).strip()
@@ -2,15 +2,167 @@
 Streamlit UI Manager - Unified interface with internationalization support
 """
 
+import asyncio
+import functools
+import itertools
+import queue
+import threading
 from datetime import datetime
 
 import streamlit as st
 from i18n import t
 
-try:
-    from utils.language_manager import LanguageManager
-except ImportError:
-    LanguageManager = None
+
+@st.cache_resource
+def get_language_manager():
+    """Get the language manager shared across sessions and reruns"""
+    # Imported on first use, the manager is only needed for language persistence
+    try:
+        from utils.language_manager import LanguageManager
+    except ImportError:
+        return None
+    return LanguageManager()
+
+
+@functools.lru_cache(maxsize=64)
+def _agent_display_name(agent_key: str, language: str) -> str:
+    """Translate an agent name, cached per language"""
+    return t(f"agents.{agent_key}")
+
+
+# Custom page styles, injected on every rerun
+PAGE_CSS = """
+<style>
+/* Hide top-right menu and toolbar */
+#MainMenu {visibility: hidden !important;}
+.stDeployButton {display: none !important;}
+.stDecoration {display: none !important;}
+header[data-testid="stHeader"] {display: none !important;}
+.stToolbar {display: none !important;}
+
+/* Hide footer */
+footer {visibility: hidden !important;}
+
+/* Hide "Made with Streamlit" */
+.viewerBadge_container__1QSob {display: none !important;}
+
+/* Optimize main container */
+.main .block-container {
+    padding-top: 1rem;
+    padding-bottom: 0rem;
+    max-width: 100%;
+}
+
+/* Reduce container spacing */
+.element-container {
+    margin-bottom: 0.5rem !important;
+}
+
+/* Reduce title spacing */
+h1 {
+    margin-bottom: 1rem !important;
+}
+
+/* Chat message styles */
+.stChatMessage {
+    margin-bottom: 1rem;
+    border-radius: 10px;
+}
+
+/* Optimize sidebar */
+.css-1d391kg {
+    padding-top: 2rem;
+}
+</style>
+"""
+
+# Chat welcome message per language
+WELCOME_MESSAGES = {
+    "en": """
+            👋 **Welcome to Agentic Lineage For Lakehouse!**
+
+            This is a true multi-agent architecture where each agent is an independent Agent instance:
+
+            - 🎯 **Orchestrator Agent**: Automatically routes requests to appropriate specialized agents
+            - 📊 **Metadata Agent**: Statistics of assets and jobs (via MCP tools)
+            - 📈 **Lineage Agent**: Query field lineage sources (via MCP tools)
+            - 🗂️ **Data Catalog Agent**: Query AWS Glue and Redshift data catalogs
+            - 🔍 **Specialist Agent**: Generate data health reports
+
+            **Example Functions:**
+            - Query namespaces: How many namespaces are in Marquez?
+            - Query field lineage: Please query the lineage source of field user_id
+            - Impact analysis: Analyze the impact of field changes
+            - Generate reports: Generate data health report
+
+            Please enter your question below to start the conversation!
+            """,
+    "zh": """
+            👋 **欢迎使用 Agentic Lineage For Lakehouse！**
+
+            这是一个真正的多代理架构，每个代理都是独立的Agent实例：
+
+            - 🎯 **协调器代理**: 自动路由请求到合适的专业代理
+            - 📊 **元数据代理**: 统计资产和作业数量（通过MCP工具）
+            - 📈 **血缘代理**: 查询字段血缘来源（通过MCP工具）
+            - 🗂️ **数据目录代理**: 查询AWS Glue和Redshift数据目录
+            - 🔍 **专家代理**: 生成血缘健康报告
+
+            **功能示例：**
+            - 查询命名空间：marquez有多少命名空间？
+            - 查询字段血缘：请查询字段 user_id 的血缘来源
+            - 影响分析：分析字段变更的影响
+            - 生成报告：生成血缘健康报告
+
+            请在下方输入您的问题开始对话！
+            """,
+}
+
+_STREAM_END = object()
+
+
+def stream_agent_text(agent, prompt: str):
+    """Yield response text chunks from the agent as Bedrock streams them"""
+    chunks = queue.Queue()
+    loop = asyncio.new_event_loop()
+
+    async def produce():
+        async for event in agent.stream_async(prompt):
+            if "data" in event:
+                chunks.put(event["data"])
+
+    task = loop.create_task(produce())
+
+    def run():
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            chunks.put(_STREAM_END)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+
+    try:
+        while (chunk := chunks.get()) is not _STREAM_END:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        # Stopped or rerun mid-response: end the agent call before the agent
+        # can be reused, Strands agents do not support concurrent calls
+        if thread.is_alive():
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # The loop already finished and closed
+                pass
+        thread.join()
 
 
 class StreamlitUI:
@@ -34,65 +186,17 @@ class StreamlitUI:
             st.session_state.init_success_count = 0
         if "language" not in st.session_state:
             # Get saved language setting from language manager
-            if LanguageManager is not None:
-                try:
-                    language_manager = LanguageManager()
-                    st.session_state.language = language_manager.get_language()
-                except Exception:
-                    st.session_state.language = "zh"  # Default to Chinese
-            else:
-                st.session_state.language = "zh"  # Default to Chinese
+            try:
+                language_manager = get_language_manager()
+                saved_language = language_manager and language_manager.get_language()
+            except Exception:
+                saved_language = None
+            st.session_state.language = saved_language or "zh"  # Default to Chinese
 
     def setup_page_config(self):
         """Setup page configuration and styles"""
         # Add custom CSS styles
-        st.markdown(
-            """
-        <style>
-        /* Hide top-right menu and toolbar */
-        #MainMenu {visibility: hidden !important;}
-        .stDeployButton {display: none !important;}
-        .stDecoration {display: none !important;}
-        header[data-testid="stHeader"] {display: none !important;}
-        .stToolbar {display: none !important;}
-
-        /* Hide footer */
-        footer {visibility: hidden !important;}
-
-        /* Hide "Made with Streamlit" */
-        .viewerBadge_container__1QSob {display: none !important;}
-
-        /* Optimize main container */
-        .main .block-container {
-            padding-top: 1rem;
-            padding-bottom: 0rem;
-            max-width: 100%;
-        }
-
-        /* Reduce container spacing */
-        .element-container {
-            margin-bottom: 0.5rem !important;
-        }
-
-        /* Reduce title spacing */
-        h1 {
-            margin-bottom: 1rem !important;
-        }
-
-        /* Chat message styles */
-        .stChatMessage {
-            margin-bottom: 1rem;
-            border-radius: 10px;
-        }
-
-        /* Optimize sidebar */
-        .css-1d391kg {
-            padding-top: 2rem;
-        }
-        </style>
-        """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
     def show_header(self):
         """Show page header"""
@@ -104,16 +208,13 @@ class StreamlitUI:
         st.markdown(t("app.subtitle"))
 
         # Only show success message during initialization
-        if hasattr(st.session_state, "init_success") and st.session_state.init_success:
+        if st.session_state.get("init_success"):
             # Show initialization success message
             st.success(t("system.init_success"))
             st.session_state.init_success = False
 
         # Show language update success message
-        if (
-            hasattr(st.session_state, "language_update_success")
-            and st.session_state.language_update_success
-        ):
+        if st.session_state.get("language_update_success"):
             st.success(t("agents.language_updated"))
             st.session_state.language_update_success = False
 
@@ -122,8 +223,16 @@ class StreamlitUI:
     def show_sidebar(self):
         """Show sidebar"""
         with st.sidebar:
-            # Language selector
-            st.subheader(t("ui.language_selector"))
+            self._render_sidebar()
+
+    # Sidebar widgets rerun only the sidebar instead of the whole app
+    @st.fragment
+    def _render_sidebar(self):
+        """Render sidebar content"""
+        # Language selector
+        st.subheader(t("ui.language_selector"))
+        # Only apply the selection on submit, not on every widget change
+        with st.form("language_form", clear_on_submit=False):
             language = st.selectbox(
                 "选择语言 / Select Language",
                 options=["zh", "en"],
@@ -132,86 +241,81 @@ class StreamlitUI:
                 key="language_selector",
                 label_visibility="collapsed",  # Hide label since we already have subheader
             )
-            if language != st.session_state.language:
-                st.session_state.language = language
-                # Save language selection
-                if LanguageManager is not None:
-                    try:
-                        language_manager = LanguageManager()
-                        language_manager.set_language(language)
-                    except Exception:
-                        pass
-
-                # Update agent system language settings
-                if hasattr(st.session_state, "system") and st.session_state.system:
-                    try:
-                        with st.spinner(t("system.initializing")):
-                            st.session_state.system.set_language(language)
-                            st.session_state.agents = st.session_state.system.agents
-                        # Show success message
-                        st.session_state.language_update_success = True
-                    except Exception as e:
-                        st.error(t("agents.language_update_failed") + f": {e}")
-
-                st.rerun()
+            submitted = st.form_submit_button(t("ui.apply_language"))
+        if submitted and language != st.session_state.language:
+            st.session_state.language = language
+            # Save language selection
+            try:
+                language_manager = get_language_manager()
+                if language_manager is not None:
+                    language_manager.set_language(language)
+            except Exception:
+                pass
+
+            # Update agent system language settings
+            if st.session_state.get("system"):
+                try:
+                    with st.spinner(t("system.initializing")):
+                        st.session_state.system.set_language(language)
+                        st.session_state.agents = st.session_state.system.agents
+                    # Show success message
+                    st.session_state.language_update_success = True
+                except Exception as e:
+                    st.error(t("agents.language_update_failed") + f": {e}")
 
-            st.divider()
-            st.header(t("ui.system_status"))
-
-            # Show system running status
-            if st.session_state.system_initialized:
-                st.success(t("system.running"))
-                st.info(t("system.agent_count", count=len(st.session_state.agents)))
-            else:
-                st.warning(t("system.initializing_status"))
-
-            # Show current active agent and tool calls
-            if (
-                hasattr(st.session_state, "current_active_agent")
-                and st.session_state.current_active_agent
-            ):
-                st.info(
-                    t(
-                        "system.current_agent",
-                        agent=self.get_agent_display_name(
-                            st.session_state.current_active_agent
-                        ),
-                    )
+            st.rerun()
+
+        st.divider()
+        st.header(t("ui.system_status"))
+
+        # Show system running status
+        if st.session_state.system_initialized:
+            st.success(t("system.running"))
+            st.info(t("system.agent_count", count=len(st.session_state.agents)))
+        else:
+            st.warning(t("system.initializing_status"))
+
+        # Show current active agent and tool calls
+        if active_agent := st.session_state.get("current_active_agent"):
+            st.info(
+                t(
+                    "system.current_agent",
+                    agent=self.get_agent_display_name(active_agent),
                 )
+            )
 
-            if (
-                hasattr(st.session_state, "current_thinking")
-                and st.session_state.current_thinking
-            ):
-                st.info(t("system.status", status=st.session_state.current_thinking))
-
-            # Show recent tool calls
-            if hasattr(st.session_state, "tool_calls") and st.session_state.tool_calls:
-                st.divider()
-                st.subheader(t("ui.tool_calls_history"))
-                # Only show recent 5 tool calls
-                recent_calls = st.session_state.tool_calls[-5:]
-                for call in reversed(recent_calls):
-                    st.caption(
-                        f"[{call.get('timestamp', '')}] {call.get('tool_name', '')} -> {self.get_agent_display_name(call.get('agent_name', ''))}"
-                    )
+        if current_thinking := st.session_state.get("current_thinking"):
+            st.info(t("system.status", status=current_thinking))
 
+        # Show recent tool calls
+        if st.session_state.get("tool_calls"):
             st.divider()
+            st.subheader(t("ui.tool_calls_history"))
+            # History only keeps the most recent tool calls
+            recent_calls = st.session_state.tool_calls
+            # Render all entries as one element instead of one caption each
+            lines = [
+                f"<small>[{call.get('timestamp', '')}] {call.get('tool_name', '')} -> {self.get_agent_display_name(call.get('agent_name', ''))}</small>"
+                for call in reversed(recent_calls)
+            ]
+            st.markdown("<br>".join(lines), unsafe_allow_html=True)
+
+        st.divider()
+
+        # Action buttons
+        if st.button(t("ui.clear_chat"), key="clear_chat"):
+            st.session_state.messages = []
+            if "tool_calls" in st.session_state:
+                st.session_state.tool_calls.clear()
+            st.rerun()
 
-            # Action buttons
-            if st.button(t("ui.clear_chat"), key="clear_chat"):
-                st.session_state.messages = []
-                if hasattr(st.session_state, "tool_calls"):
-                    st.session_state.tool_calls = []
-                st.rerun()
-
-            if st.button(t("ui.reinit_system"), key="reinit_system"):
-                st.session_state.system_initialized = False
-                st.session_state.agents = {}
-                st.session_state.messages = []
-                if hasattr(st.session_state, "tool_calls"):
-                    st.session_state.tool_calls = []
-                st.rerun()
+        if st.button(t("ui.reinit_system"), key="reinit_system"):
+            st.session_state.system_initialized = False
+            st.session_state.agents = {}
+            st.session_state.messages = []
+            if "tool_calls" in st.session_state:
+                st.session_state.tool_calls.clear()
+            st.rerun()
 
     def show_chat_interface(self):
         """Show chat interface"""
@@ -262,22 +366,15 @@ class StreamlitUI:
             thinking_placeholder.info(t("ui.thinking", agent=agent_name))
 
             try:
-                # Call agent
+                # Call agent, keeping the thinking status until the first token
                 agent = st.session_state.agents[current_agent]
-                response = agent(prompt)
+                chunks = stream_agent_text(agent, prompt)
+                first_chunk = next(chunks, "")
 
-                # Handle AgentResult object
-                if hasattr(response, "content"):
-                    content = response.content
-                elif hasattr(response, "text"):
-                    content = response.text
-                else:
-                    content = str(response)
-
-                # Clear thinking status, show response
+                # Clear thinking status, stream response
                 thinking_placeholder.empty()
                 st.success(t("ui.agent_reply", agent=agent_name))
-                st.markdown(content)
+                content = st.write_stream(itertools.chain((first_chunk,), chunks))
 
                 # Add to message history
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -296,48 +393,7 @@ class StreamlitUI:
 
     def show_welcome_message(self):
         """Show welcome message"""
-        if st.session_state.language == "en":
-            welcome_text = """
-            👋 **Welcome to Agentic Lineage For Lakehouse!**
-
-            This is a true multi-agent architecture where each agent is an independent Agent instance:
-
-            - 🎯 **Orchestrator Agent**: Automatically routes requests to appropriate specialized agents
-            - 📊 **Metadata Agent**: Statistics of assets and jobs (via MCP tools)
-            - 📈 **Lineage Agent**: Query field lineage sources (via MCP tools)
-            - 🗂️ **Data Catalog Agent**: Query AWS Glue and Redshift data catalogs
-            - 🔍 **Specialist Agent**: Generate data health reports
-
-            **Example Functions:**
-            - Query namespaces: How many namespaces are in Marquez?
-            - Query field lineage: Please query the lineage source of field user_id
-            - Impact analysis: Analyze the impact of field changes
-            - Generate reports: Generate data health report
-
-            Please enter your question below to start the conversation!
-            """
-        else:
-            welcome_text = """
-            👋 **欢迎使用 Agentic Lineage For Lakehouse！**
-
-            这是一个真正的多代理架构，每个代理都是独立的Agent实例：
-
-            - 🎯 **协调器代理**: 自动路由请求到合适的专业代理
-            - 📊 **元数据代理**: 统计资产和作业数量（通过MCP工具）
-            - 📈 **血缘代理**: 查询字段血缘来源（通过MCP工具）
-            - 🗂️ **数据目录代理**: 查询AWS Glue和Redshift数据目录
-            - 🔍 **专家代理**: 生成血缘健康报告
-
-            **功能示例：**
-            - 查询命名空间：marquez有多少命名空间？
-            - 查询字段血缘：请查询字段 user_id 的血缘来源
-            - 影响分析：分析字段变更的影响
-            - 生成报告：生成血缘健康报告
-
-            请在下方输入您的问题开始对话！
-            """
-
-        st.info(welcome_text)
+        st.info(WELCOME_MESSAGES.get(st.session_state.language, WELCOME_MESSAGES["zh"]))
 
     def show_help_section(self):
         """Show help section"""
@@ -345,4 +401,4 @@ class StreamlitUI:
 
     def get_agent_display_name(self, agent_key: str) -> str:
         """Get agent display name"""
-        return t(f"agents.{agent_key}")
+        return _agent_display_name(agent_key, st.session_state.get("language", "zh"))
@@ -0,0 +1,29 @@
+"""
+AWS Client Configuration - Shared botocore settings for all boto3 clients
+"""
+
+import functools
+
+import boto3
+from botocore.config import Config
+
+
+def get_boto_config(max_pool_connections: int = 32, read_timeout: int = 30) -> Config:
+    """Get botocore config with adaptive retries and keep-alive connections
+
+    Adaptive retry mode rate-limits on the client side before the service
+    throttles, so Bedrock/Glue throttling turns into latency instead of errors.
+    """
+    return Config(
+        max_pool_connections=max_pool_connections,
+        retries={"max_attempts": 20, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=read_timeout,
+    )
+
+
+@functools.cache
+def get_glue_client(region: str):
+    """Get the process-wide Glue client for a region, sharing its connection pool"""
+    return boto3.Session().client("glue", region_name=region, config=get_boto_config())
@@ -4,6 +4,9 @@ Configuration Validator - Responsible for validating system configuration
 
 from config import settings
 
+# Settings that must be present and non-empty
+REQUIRED_CONFIGS = ("MARQUEZ_MCP_URL", "BEDROCK_MODEL_ID")
+
 
 class ConfigValidator:
     """Configuration validator"""
@@ -17,12 +20,9 @@ class ConfigValidator:
         """
         print("🔧 Checking system configuration...")
 
-        required_configs = ["MARQUEZ_MCP_URL", "BEDROCK_MODEL_ID"]
-
-        missing_configs = []
-        for config in required_configs:
-            if not hasattr(settings, config) or not getattr(settings, config):
-                missing_configs.append(config)
+        missing_configs = [
+            config for config in REQUIRED_CONFIGS if not getattr(settings, config, None)
+        ]
 
         if missing_configs:
             print(f"❌ Missing required configurations: {', '.join(missing_configs)}")
@@ -7,6 +7,38 @@ from strands import tool
 
 from .glue_connector import glue_connector
 from .redshift_connector import redshift_connector
+from .ttl_cache import ttl_cache
+
+# Table type markers used in Redshift listings
+TABLE_TYPE_INDICATORS = {"regular": "📊", "external": "🔗"}
+
+# Redshift catalog metadata changes rarely; reuse query results for a while
+# (GlueConnector caches its own results)
+CATALOG_CACHE_TTL_SECONDS = 300
+
+_cached_redshift_schemas = ttl_cache(CATALOG_CACHE_TTL_SECONDS)(
+    redshift_connector.get_schemas
+)
+_cached_redshift_tables = ttl_cache(CATALOG_CACHE_TTL_SECONDS)(
+    redshift_connector.get_tables
+)
+_cached_redshift_table_columns = ttl_cache(CATALOG_CACHE_TTL_SECONDS)(
+    redshift_connector.get_table_columns
+)
+_cached_redshift_search = ttl_cache(CATALOG_CACHE_TTL_SECONDS)(
+    redshift_connector.search_tables
+)
+_cached_redshift_external_tables = ttl_cache(CATALOG_CACHE_TTL_SECONDS)(
+    redshift_connector.get_external_tables
+)
+_cached_redshift_statistics = ttl_cache(CATALOG_CACHE_TTL_SECONDS)(
+    redshift_connector.get_statistics
+)
+
+
+def _truncate(text: str, limit: int = 50) -> str:
+    """Shorten text to limit characters, marking truncation with an ellipsis"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
 
 
 # AWS Glue Tools
@@ -25,10 +57,12 @@ def get_glue_database_details() -> str:
     """Get AWS Glue database detailed information"""
     try:
         databases = glue_connector.get_database_details()
-        result = "AWS Glue database details:\n"
-        for db in databases:
-            result += f"- {db['name']}: {db.get('description', 'No description')}\n"
-        return result
+        lines = ["AWS Glue database details:"]
+        lines.extend(
+            f"- {db['name']}: {db.get('description', 'No description')}"
+            for db in databases
+        )
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get Glue database details: {str(e)}"
 
@@ -43,48 +77,83 @@ def get_glue_tables(database_name: str = None) -> str:
             return f"Too many query results ({len(tables)} tables), recommend specifying a specific database name for query"
 
         if database_name:
-            result = f"Tables in database {database_name} ({len(tables)} total):\n"
+            lines = [f"Tables in database {database_name} ({len(tables)} total):"]
         else:
-            result = f"All AWS Glue tables ({len(tables)} total):\n"
+            lines = [f"All AWS Glue tables ({len(tables)} total):"]
 
-        for table in tables[:100]:  # Limit to first 100
-            result += f"- {table['database']}.{table['name']} (location: {table['location'][:50]}...)\n"
+        # Limit to first 100
+        lines.extend(
+            f"- {table['database']}.{table['name']} (location: {_truncate(table['location'])})"
+            for table in tables[:100]
+        )
 
         if len(tables) > 100:
-            result += f"... {len(tables) - 100} more tables not displayed"
+            lines.append(f"... {len(tables) - 100} more tables not displayed")
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get Glue table information: {str(e)}"
 
 
+def _format_table_details(table_info: dict) -> list[str]:
+    """Format Glue table details as output lines"""
+    columns = table_info["columns"]
+
+    lines = [
+        f"Table {table_info['database']}.{table_info['name']} details:",
+        f"- Type: {table_info['table_type']}",
+        f"- Location: {table_info['location']}",
+        f"- Input format: {table_info['input_format']}",
+        f"- Output format: {table_info['output_format']}",
+        f"- Column count: {len(columns)}",
+    ]
+
+    if columns:
+        lines.append("- Column information:")
+        # Limit to first 20 columns
+        lines.extend(f"  * {col['name']} ({col['type']})" for col in columns[:20])
+
+        if len(columns) > 20:
+            lines.append(f"  ... {len(columns) - 20} more columns not displayed")
+
+    if table_info["partition_keys"]:
+        lines.append("- Partition keys:")
+        lines.extend(
+            f"  * {pk['name']} ({pk['type']})" for pk in table_info["partition_keys"]
+        )
+
+    return lines
+
+
 @tool
 def get_glue_table_details(database_name: str, table_name: str) -> str:
     """Get AWS Glue table detailed information"""
     try:
         table_info = glue_connector.get_table_details(database_name, table_name)
+        return "\n".join(_format_table_details(table_info))
+    except Exception as e:
+        return f"Failed to get table details: {str(e)}"
 
-        result = f"Table {database_name}.{table_name} details:\n"
-        result += f"- Type: {table_info['table_type']}\n"
-        result += f"- Location: {table_info['location']}\n"
-        result += f"- Input format: {table_info['input_format']}\n"
-        result += f"- Output format: {table_info['output_format']}\n"
-        result += f"- Column count: {len(table_info['columns'])}\n"
 
-        if table_info["columns"]:
-            result += "- Column information:\n"
-            for col in table_info["columns"][:20]:  # Limit to first 20 columns
-                result += f"  * {col['name']} ({col['type']})\n"
+@tool
+def get_glue_tables_details(database_name: str, table_names: list[str]) -> str:
+    """Get AWS Glue detailed information for several tables of one database, prefer this over repeated single-table lookups"""
+    try:
+        tables = glue_connector.get_tables_details(database_name, table_names)
+
+        if not tables:
+            return f"No matching tables found in database {database_name}"
 
-            if len(table_info["columns"]) > 20:
-                result += f"  ... {len(table_info['columns']) - 20} more columns not displayed\n"
+        lines = []
+        for table_info in tables:
+            lines.extend(_format_table_details(table_info))
 
-        if table_info["partition_keys"]:
-            result += "- Partition keys:\n"
-            for pk in table_info["partition_keys"]:
-                result += f"  * {pk['name']} ({pk['type']})\n"
+        found = {table_info["name"] for table_info in tables}
+        missing = [name for name in table_names if name.lower() not in found]
+        if missing:
+            lines.append(f"Tables not found: {', '.join(missing)}")
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get table details: {str(e)}"
 
@@ -98,14 +167,14 @@ def search_glue_tables(search_text: str) -> str:
         if not tables:
             return f"No tables found containing '{search_text}'"
 
-        result = f"Search '{search_text}' found {len(tables)} tables:\n"
-        for table in tables[:50]:  # Limit to first 50
-            result += f"- {table['database']}.{table['name']}\n"
+        lines = [f"Search '{search_text}' found {len(tables)} tables:"]
+        # Limit to first 50
+        lines.extend(f"- {table['database']}.{table['name']}" for table in tables[:50])
 
         if len(tables) > 50:
-            result += f"... {len(tables) - 50} more tables not displayed"
+            lines.append(f"... {len(tables) - 50} more tables not displayed")
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to search tables: {str(e)}"
 
@@ -116,20 +185,22 @@ def get_glue_statistics() -> str:
     try:
         stats = glue_connector.get_statistics()
 
-        result = "AWS Glue data catalog statistics:\n"
-        result += f"- Total databases: {stats['total_databases']}\n"
-        result += f"- Total tables: {stats['total_tables']}\n"
-        result += "- Database details:\n"
-
-        for db_stat in stats["database_details"]:
-            if "error" in db_stat:
-                result += f"  * {db_stat['database']}: {db_stat['error']}\n"
-            else:
-                result += (
-                    f"  * {db_stat['database']}: {db_stat['table_count']} tables\n"
-                )
+        lines = [
+            "AWS Glue data catalog statistics:",
+            f"- Total databases: {stats['total_databases']}",
+            f"- Total tables: {stats['total_tables']}",
+            "- Database details:",
+        ]
+        lines.extend(
+            (
+                f"  * {db_stat['database']}: {db_stat['error']}"
+                if "error" in db_stat
+                else f"  * {db_stat['database']}: {db_stat['table_count']} tables"
+            )
+            for db_stat in stats["database_details"]
+        )
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get Glue statistics: {str(e)}"
 
@@ -139,15 +210,15 @@ def get_glue_statistics() -> str:
 def get_redshift_schemas() -> str:
     """Get Redshift schema information"""
     try:
-        schemas = redshift_connector.get_schemas()
+        schemas = _cached_redshift_schemas()
 
-        result = f"Redshift database schemas ({len(schemas)} total):\n"
-        for schema in schemas:
-            result += (
-                f"- {schema['schemaname']}: {schema.get('table_count', 0)} tables\n"
-            )
+        lines = [f"Redshift database schemas ({len(schemas)} total):"]
+        lines.extend(
+            f"- {schema['schemaname']}: {schema.get('table_count', 0)} tables"
+            for schema in schemas
+        )
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get Redshift schemas: {str(e)}"
 
@@ -156,29 +227,26 @@ def get_redshift_schemas() -> str:
 def get_redshift_tables(schema_name: str = None) -> str:
     """Get Redshift table information"""
     try:
-        tables = redshift_connector.get_tables(schema_name)
+        tables = _cached_redshift_tables(schema_name)
 
         if len(tables) > 500:
             return f"Too many query results ({len(tables)} tables), recommend specifying a specific schema name for query"
 
         if schema_name:
-            result = f"Tables in schema {schema_name} ({len(tables)} total):\n"
+            lines = [f"Tables in schema {schema_name} ({len(tables)} total):"]
         else:
-            result = f"All Redshift tables ({len(tables)} total):\n"
-
-        for table in tables[:100]:  # Limit to first 100
-            table_type = table.get("table_type", "unknown")
-            type_indicator = (
-                "📊"
-                if table_type == "regular"
-                else "🔗" if table_type == "external" else "❓"
-            )
-            result += f"- {type_indicator} {table['schemaname']}.{table['tablename']} (owner: {table['tableowner']}, type: {table_type})\n"
+            lines = [f"All Redshift tables ({len(tables)} total):"]
+
+        # Limit to first 100
+        lines.extend(
+            f"- {TABLE_TYPE_INDICATORS.get(table.get('table_type'), '❓')} {table['schemaname']}.{table['tablename']} (owner: {table['tableowner']}, type: {table.get('table_type', 'unknown')})"
+            for table in tables[:100]
+        )
 
         if len(tables) > 100:
-            result += f"... {len(tables) - 100} more tables not displayed"
+            lines.append(f"... {len(tables) - 100} more tables not displayed")
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get Redshift table information: {str(e)}"
 
@@ -187,14 +255,41 @@ def get_redshift_tables(schema_name: str = None) -> str:
 def get_redshift_table_columns(schema_name: str, table_name: str) -> str:
     """Get Redshift table column information"""
     try:
-        columns = redshift_connector.get_table_columns(schema_name, table_name)
+        columns = _cached_redshift_table_columns(schema_name, table_name)
+
+        lines = [
+            f"Column information for table {schema_name}.{table_name} ({len(columns)} columns):"
+        ]
+        lines.extend(
+            f"- {col['column_name']} ({col['data_type']}) - {'nullable' if col.get('is_nullable') == 'YES' else 'not null'}"
+            for col in columns
+        )
+
+        return "\n".join(lines)
+    except Exception as e:
+        return f"Failed to get table column information: {str(e)}"
+
+
+@tool
+def get_redshift_tables_columns(schema_name: str, table_names: list[str]) -> str:
+    """Get Redshift column information for several tables of one schema, prefer this over repeated single-table lookups"""
+    try:
+        tables_columns = redshift_connector.get_tables_columns(schema_name, table_names)
+
+        if not tables_columns:
+            return f"No columns found for the given tables in schema {schema_name}"
 
-        result = f"Column information for table {schema_name}.{table_name} ({len(columns)} columns):\n"
-        for col in columns:
-            nullable = "nullable" if col.get("is_nullable") == "YES" else "not null"
-            result += f"- {col['column_name']} ({col['data_type']}) - {nullable}\n"
+        lines = []
+        for table_name, columns in tables_columns.items():
+            lines.append(
+                f"Column information for table {schema_name}.{table_name} ({len(columns)} columns):"
+            )
+            lines.extend(
+                f"- {col['column_name']} ({col['data_type']}) - {'nullable' if col.get('is_nullable') == 'YES' else 'not null'}"
+                for col in columns
+            )
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get table column information: {str(e)}"
 
@@ -203,25 +298,22 @@ def get_redshift_table_columns(schema_name: str, table_name: str) -> str:
 def search_redshift_tables(search_text: str) -> str:
     """Search Redshift tables"""
     try:
-        tables = redshift_connector.search_tables(search_text)
+        tables = _cached_redshift_search(search_text)
 
         if not tables:
             return f"No tables found containing '{search_text}'"
 
-        result = f"Search '{search_text}' found {len(tables)} tables:\n"
-        for table in tables[:50]:  # Limit to first 50
-            table_type = table.get("table_type", "unknown")
-            type_indicator = (
-                "📊"
-                if table_type == "regular"
-                else "🔗" if table_type == "external" else "❓"
-            )
-            result += f"- {type_indicator} {table['schemaname']}.{table['tablename']} (type: {table_type})\n"
+        lines = [f"Search '{search_text}' found {len(tables)} tables:"]
+        # Limit to first 50
+        lines.extend(
+            f"- {TABLE_TYPE_INDICATORS.get(table.get('table_type'), '❓')} {table['schemaname']}.{table['tablename']} (type: {table.get('table_type', 'unknown')})"
+            for table in tables[:50]
+        )
 
         if len(tables) > 50:
-            result += f"... {len(tables) - 50} more tables not displayed"
+            lines.append(f"... {len(tables) - 50} more tables not displayed")
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to search tables: {str(e)}"
 
@@ -230,26 +322,30 @@ def search_redshift_tables(search_text: str) -> str:
 def get_redshift_external_tables(schema_name: str = None) -> str:
     """Get Redshift external table information"""
     try:
-        external_tables = redshift_connector.get_external_tables(schema_name)
+        external_tables = _cached_redshift_external_tables(schema_name)
 
         if len(external_tables) > 500:
             return f"Too many query results ({len(external_tables)} external tables), recommend specifying a specific schema name for query"
 
         if schema_name:
-            result = f"External tables in schema {schema_name} ({len(external_tables)} total):\n"
+            lines = [
+                f"External tables in schema {schema_name} ({len(external_tables)} total):"
+            ]
         else:
-            result = f"All Redshift external tables ({len(external_tables)} total):\n"
+            lines = [f"All Redshift external tables ({len(external_tables)} total):"]
 
-        for table in external_tables[:100]:  # Limit to first 100
-            location = table.get("location", "N/A")
-            result += f"- 🔗 {table['schemaname']}.{table['tablename']} (owner: {table['tableowner']}, location: {location})\n"
+        # Limit to first 100
+        lines.extend(
+            f"- 🔗 {table['schemaname']}.{table['tablename']} (owner: {table['tableowner']}, location: {table.get('location', 'N/A')})"
+            for table in external_tables[:100]
+        )
 
         if len(external_tables) > 100:
-            result += (
+            lines.append(
                 f"... {len(external_tables) - 100} more external tables not displayed"
             )
 
-        return result
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get Redshift external table information: {str(e)}"
 
@@ -258,19 +354,22 @@ def get_redshift_external_tables(schema_name: str = None) -> str:
 def get_redshift_statistics() -> str:
     """Get Redshift statistics"""
     try:
-        stats = redshift_connector.get_statistics()
-
-        result = "Redshift database statistics:\n"
-        result += f"- Total schemas: {stats['total_schemas']}\n"
-        result += f"- Total tables: {stats['total_tables']}\n"
-        result += f"- External tables: {stats.get('total_external_tables', 0)}\n"
-        result += f"- Connection type: {stats['connection_type']}\n"
-        result += "- Schema details:\n"
-
-        for schema_stat in stats["schema_details"]:
-            result += f"  * {schema_stat['schemaname']}: {schema_stat.get('table_count', 0)} tables\n"
-
-        return result
+        stats = _cached_redshift_statistics()
+
+        lines = [
+            "Redshift database statistics:",
+            f"- Total schemas: {stats['total_schemas']}",
+            f"- Total tables: {stats['total_tables']}",
+            f"- External tables: {stats.get('total_external_tables', 0)}",
+            f"- Connection type: {stats['connection_type']}",
+            "- Schema details:",
+        ]
+        lines.extend(
+            f"  * {schema_stat['schemaname']}: {schema_stat.get('table_count', 0)} tables"
+            for schema_stat in stats["schema_details"]
+        )
+
+        return "\n".join(lines)
     except Exception as e:
         return f"Failed to get Redshift statistics: {str(e)}"
 
@@ -290,24 +389,26 @@ def test_redshift_connection() -> str:
         return f"❌ Connection test failed: {str(e)}"
 
 
-# Export all tools
-GLUE_TOOLS = [
+# Export all tools (tuples, shared read-only by every agent instance)
+GLUE_TOOLS = (
     get_glue_databases,
     get_glue_database_details,
     get_glue_tables,
     get_glue_table_details,
+    get_glue_tables_details,
     search_glue_tables,
     get_glue_statistics,
-]
+)
 
-REDSHIFT_TOOLS = [
+REDSHIFT_TOOLS = (
     get_redshift_schemas,
     get_redshift_tables,
     get_redshift_external_tables,
     get_redshift_table_columns,
+    get_redshift_tables_columns,
     search_redshift_tables,
     get_redshift_statistics,
     test_redshift_connection,
-]
+)
 
 DATACATALOG_TOOLS = GLUE_TOOLS + REDSHIFT_TOOLS
@@ -2,35 +2,49 @@
 AWS Glue Connector Tool
 """
 
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-import boto3
 from config import settings
 
+from .aws import get_glue_client
+from .ttl_cache import ttl_cache
+
+# Concurrent Glue API calls when fanning out across databases
+MAX_WORKERS = 16
+
+# Catalog metadata changes on the order of minutes, reuse results meanwhile
+CACHE_TTL_SECONDS = 300
+
+# GetTables rejects name expressions longer than this
+GLUE_EXPRESSION_MAX_LENGTH = 2048
+
 
 class GlueConnector:
     """AWS Glue Data Catalog Connector"""
 
-    def __init__(self):
-        self.glue_client = boto3.client(
-            "glue", region_name=settings.get("bedrock.region", "us-west-2")
-        )
+    @property
+    def glue_client(self):
+        """Shared Glue client, created on first use"""
+        return get_glue_client(settings.get("bedrock.region", "us-west-2"))
 
+    @ttl_cache(CACHE_TTL_SECONDS, maxsize=256)
     def get_databases(self) -> list[str]:
         """Get all database names"""
         try:
-            response = self.glue_client.get_databases()
-            return [db["Name"] for db in response["DatabaseList"]]
+            return [db["Name"] for db in self._iter_databases()]
         except Exception as e:
             raise Exception(f"Failed to get Glue databases: {str(e)}") from e
 
+    @ttl_cache(CACHE_TTL_SECONDS, maxsize=256)
     def get_database_details(self) -> list[dict[str, Any]]:
         """Get database detailed information"""
         try:
-            response = self.glue_client.get_databases()
             databases = []
 
-            for db in response["DatabaseList"]:
+            for db in self._iter_databases():
                 databases.append(
                     {
                         "name": db["Name"],
@@ -44,80 +58,106 @@ class GlueConnector:
         except Exception as e:
             raise Exception(f"Failed to get Glue database details: {str(e)}") from e
 
+    def _iter_databases(self):
+        """Iterate over all databases across result pages"""
+        paginator = self.glue_client.get_paginator("get_databases")
+        for page in paginator.paginate():
+            yield from page["DatabaseList"]
+
+    @staticmethod
+    def _to_table_info(table: dict[str, Any], database_name: str) -> dict[str, Any]:
+        """Convert a Glue table description into table information"""
+        storage_descriptor = table.get("StorageDescriptor") or {}
+        return {
+            "name": table["Name"],
+            "database": database_name,
+            "location": storage_descriptor.get("Location", ""),
+            "input_format": storage_descriptor.get("InputFormat", ""),
+            "output_format": storage_descriptor.get("OutputFormat", ""),
+            "columns": len(storage_descriptor.get("Columns", [])),
+            "table_type": table.get("TableType", ""),
+            "parameters": table.get("Parameters", {}),
+        }
+
+    @classmethod
+    def _to_table_details(
+        cls, table: dict[str, Any], database_name: str
+    ) -> dict[str, Any]:
+        """Convert a Glue table description into table information with columns"""
+        columns = (table.get("StorageDescriptor") or {}).get("Columns", [])
+
+        return {
+            **cls._to_table_info(table, database_name),
+            "columns": [
+                {
+                    "name": col["Name"],
+                    "type": col["Type"],
+                    "comment": col.get("Comment", ""),
+                }
+                for col in columns
+            ],
+            "partition_keys": [
+                {
+                    "name": pk["Name"],
+                    "type": pk["Type"],
+                    "comment": pk.get("Comment", ""),
+                }
+                for pk in table.get("PartitionKeys", [])
+            ],
+        }
+
+    def _fetch_tables(self, database_name: str) -> list[dict[str, Any]]:
+        """Get all tables of a database across result pages"""
+        tables = []
+        paginator = self.glue_client.get_paginator("get_tables")
+
+        for page in paginator.paginate(DatabaseName=database_name):
+            tables.extend(
+                self._to_table_info(table, database_name) for table in page["TableList"]
+            )
+
+        return tables
+
+    def _fetch_tables_or_none(self, database_name: str) -> list[dict[str, Any]] | None:
+        """Get all tables of a database, None if the database is inaccessible"""
+        try:
+            return self._fetch_tables(database_name)
+        except Exception:
+            return None
+
+    @ttl_cache(CACHE_TTL_SECONDS, maxsize=1)
+    def _scan_catalog(self) -> dict[str, list[dict[str, Any]] | None]:
+        """Get tables of every database in one concurrent sweep"""
+        databases = self.get_databases()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return dict(
+                zip(
+                    databases,
+                    executor.map(self._fetch_tables_or_none, databases),
+                    strict=True,
+                )
+            )
+
+    @ttl_cache(CACHE_TTL_SECONDS, maxsize=256)
     def get_tables(self, database_name: str | None = None) -> list[dict[str, Any]]:
         """Get table information"""
         try:
             if database_name:
                 # Get tables from specified database
-                response = self.glue_client.get_tables(DatabaseName=database_name)
-                tables = []
-
-                for table in response["TableList"]:
-                    tables.append(
-                        {
-                            "name": table["Name"],
-                            "database": database_name,
-                            "location": table.get("StorageDescriptor", {}).get(
-                                "Location", ""
-                            ),
-                            "input_format": table.get("StorageDescriptor", {}).get(
-                                "InputFormat", ""
-                            ),
-                            "output_format": table.get("StorageDescriptor", {}).get(
-                                "OutputFormat", ""
-                            ),
-                            "columns": len(
-                                table.get("StorageDescriptor", {}).get("Columns", [])
-                            ),
-                            "table_type": table.get("TableType", ""),
-                            "parameters": table.get("Parameters", {}),
-                        }
-                    )
+                return self._fetch_tables(database_name)
 
-                return tables
-            else:
-                # Get tables from all databases
-                databases = self.get_databases()
-                all_tables = []
-
-                for db_name in databases:
-                    try:
-                        tables_response = self.glue_client.get_tables(
-                            DatabaseName=db_name
-                        )
-
-                        for table in tables_response["TableList"]:
-                            all_tables.append(
-                                {
-                                    "name": table["Name"],
-                                    "database": db_name,
-                                    "location": table.get("StorageDescriptor", {}).get(
-                                        "Location", ""
-                                    ),
-                                    "input_format": table.get(
-                                        "StorageDescriptor", {}
-                                    ).get("InputFormat", ""),
-                                    "output_format": table.get(
-                                        "StorageDescriptor", {}
-                                    ).get("OutputFormat", ""),
-                                    "columns": len(
-                                        table.get("StorageDescriptor", {}).get(
-                                            "Columns", []
-                                        )
-                                    ),
-                                    "table_type": table.get("TableType", ""),
-                                    "parameters": table.get("Parameters", {}),
-                                }
-                            )
-                    except Exception:
-                        # Skip inaccessible databases
-                        continue
-
-                return all_tables
+            # Get tables from all databases, skipping inaccessible ones
+            return [
+                table
+                for tables in self._scan_catalog().values()
+                if tables
+                for table in tables
+            ]
 
         except Exception as e:
             raise Exception(f"Failed to get Glue table information: {str(e)}") from e
 
+    @ttl_cache(CACHE_TTL_SECONDS, maxsize=256)
     def get_table_details(self, database_name: str, table_name: str) -> dict[str, Any]:
         """Get detailed table information including column information"""
         try:
@@ -125,78 +165,92 @@ class GlueConnector:
                 DatabaseName=database_name, Name=table_name
             )
 
-            table = response["Table"]
-            storage_descriptor = table.get("StorageDescriptor", {})
-            columns = storage_descriptor.get("Columns", [])
-
-            return {
-                "name": table["Name"],
-                "database": database_name,
-                "location": storage_descriptor.get("Location", ""),
-                "input_format": storage_descriptor.get("InputFormat", ""),
-                "output_format": storage_descriptor.get("OutputFormat", ""),
-                "table_type": table.get("TableType", ""),
-                "parameters": table.get("Parameters", {}),
-                "columns": [
-                    {
-                        "name": col["Name"],
-                        "type": col["Type"],
-                        "comment": col.get("Comment", ""),
-                    }
-                    for col in columns
-                ],
-                "partition_keys": [
-                    {
-                        "name": pk["Name"],
-                        "type": pk["Type"],
-                        "comment": pk.get("Comment", ""),
-                    }
-                    for pk in table.get("PartitionKeys", [])
-                ],
-            }
+            return self._to_table_details(response["Table"], database_name)
 
         except Exception as e:
             raise Exception(
                 f"Failed to get details for table {database_name}.{table_name}: {str(e)}"
             ) from e
 
+    def get_tables_details(
+        self, database_name: str, table_names: Iterable[str]
+    ) -> list[dict[str, Any]]:
+        """Get detailed information for several tables of a database at once"""
+        try:
+            # Glue stores table names in lowercase
+            names = list(dict.fromkeys(name.lower() for name in table_names))
+            paginator = self.glue_client.get_paginator("get_tables")
+            tables = []
+
+            # One name expression per batch instead of one GetTable call per table
+            for expression in self._name_expressions(names):
+                for page in paginator.paginate(
+                    DatabaseName=database_name, Expression=expression
+                ):
+                    tables.extend(
+                        self._to_table_details(table, database_name)
+                        for table in page["TableList"]
+                    )
+
+            return tables
+
+        except Exception as e:
+            raise Exception(
+                f"Failed to get table details in database {database_name}: {str(e)}"
+            ) from e
+
+    @staticmethod
+    def _name_expressions(names: Iterable[str]) -> Iterable[str]:
+        """Pack exact table name matches into as few GetTables expressions as fit"""
+        batch = []
+        # Length of "^(...)$" around the alternatives
+        length = 4
+        for name in map(re.escape, names):
+            # Each further name also adds a "|" separator
+            if batch and length + len(name) + 1 > GLUE_EXPRESSION_MAX_LENGTH:
+                yield f"^({'|'.join(batch)})$"
+                batch = []
+                length = 4
+            length += len(name) + bool(batch)
+            batch.append(name)
+
+        if batch:
+            yield f"^({'|'.join(batch)})$"
+
+    @ttl_cache(CACHE_TTL_SECONDS, maxsize=256)
     def search_tables(self, search_text: str) -> list[dict[str, Any]]:
         """Search for tables containing specified text in table name"""
         try:
-            all_tables = self.get_tables()
-            matching_tables = [
+            search_lower = search_text.lower()
+
+            # Substring match over the shared catalog sweep; SearchTables only
+            # matches whole tokens and would miss partial table names
+            return [
                 table
-                for table in all_tables
-                if search_text.lower() in table["name"].lower()
+                for table in self.get_tables()
+                if search_lower in table["name"].lower()
             ]
-            return matching_tables
         except Exception as e:
             raise Exception(f"Failed to search tables: {str(e)}") from e
 
+    @ttl_cache(CACHE_TTL_SECONDS, maxsize=256)
     def get_statistics(self) -> dict[str, Any]:
         """Get Glue data catalog statistics"""
         try:
-            databases = self.get_databases()
-            total_tables = 0
-            database_stats = []
-
-            for db_name in databases:
-                try:
-                    tables = self.get_tables(db_name)
-                    table_count = len(tables)
-                    total_tables += table_count
-
-                    database_stats.append(
-                        {"database": db_name, "table_count": table_count}
-                    )
-                except Exception:
-                    database_stats.append(
-                        {"database": db_name, "table_count": 0, "error": "Inaccessible"}
-                    )
+            # Shares the catalog sweep with get_tables() instead of its own lookups
+            catalog = self._scan_catalog()
+            database_stats = [
+                (
+                    {"database": db_name, "table_count": 0, "error": "Inaccessible"}
+                    if tables is None
+                    else {"database": db_name, "table_count": len(tables)}
+                )
+                for db_name, tables in catalog.items()
+            ]
 
             return {
-                "total_databases": len(databases),
-                "total_tables": total_tables,
+                "total_databases": len(catalog),
+                "total_tables": sum(stat["table_count"] for stat in database_stats),
                 "database_details": database_stats,
             }
 
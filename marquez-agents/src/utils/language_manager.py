@@ -12,6 +12,8 @@ class LanguageManager:
     def __init__(self):
         self.config_dir = os.path.join(os.path.dirname(__file__), "..", "..", "config")
         self.config_file = os.path.join(self.config_dir, "language.json")
+        # (file mtime, language) of the last read, reused while the file is unchanged
+        self._cached_language: tuple[float, str] | None = None
         self.ensure_config_dir()
 
     def ensure_config_dir(self):
@@ -22,13 +24,21 @@ class LanguageManager:
     def get_language(self) -> str:
         """Get current language setting"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, encoding="utf-8") as f:
-                    config = json.load(f)
-                    return config.get("language", "zh")
+            mtime = os.stat(self.config_file).st_mtime
+        except OSError:
+            return "zh"  # Default to Chinese
+
+        if self._cached_language is not None and self._cached_language[0] == mtime:
+            return self._cached_language[1]
+
+        try:
+            with open(self.config_file, encoding="utf-8") as f:
+                language = json.load(f).get("language", "zh")
         except Exception:
-            pass
-        return "zh"  # Default to Chinese
+            return "zh"  # Default to Chinese
+
+        self._cached_language = (mtime, language)
+        return language
 
     def set_language(self, language: str):
         """Set language"""
@@ -36,6 +46,7 @@ class LanguageManager:
             config = {"language": language}
             with open(self.config_file, "w", encoding="utf-8") as f:
                 json.dump(config, f, ensure_ascii=False, indent=2)
+            self._cached_language = (os.stat(self.config_file).st_mtime, language)
         except Exception as e:
             print(f"Warning: Could not save language preference: {e}")
 
@@ -2,36 +2,67 @@
 Redshift Connector Tool (Direct Connection)
 """
 
+import itertools
+import threading
+from collections.abc import Iterable
 from typing import Any
 
-import psycopg2
 from config import settings
+from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+
+# Maximum open Redshift connections kept by the pool
+MAX_POOL_CONNECTIONS = 10
+
+# Settings needed for a direct connection, mock data is returned without them
+REQUIRED_CONFIGS = (
+    "REDSHIFT_HOST",
+    "REDSHIFT_DATABASE",
+    "REDSHIFT_USERNAME",
+    "REDSHIFT_PASSWORD",
+)
 
 
 class RedshiftConnector:
     """Redshift Database Connector"""
 
     def __init__(self):
-        self.connection = None
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # getconn() fails at once when the pool is exhausted, wait for a slot instead
+        self._pool_slots = threading.BoundedSemaphore(MAX_POOL_CONNECTIONS)
+        # Settings are loaded once at startup, so check them only once
+        self._missing_configs = tuple(
+            config for config in REQUIRED_CONFIGS if not getattr(settings, config, None)
+        )
 
-    def _check_config(self) -> list[str]:
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Get the connection pool, creating it on first use"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=MAX_POOL_CONNECTIONS,
+                    host=settings.REDSHIFT_HOST,
+                    port=getattr(settings, "REDSHIFT_PORT", 5439),
+                    database=settings.REDSHIFT_DATABASE,
+                    user=settings.REDSHIFT_USERNAME,
+                    password=settings.REDSHIFT_PASSWORD,
+                    connect_timeout=30,
+                    # Keep idle pooled connections from being dropped by NAT timeouts
+                    keepalives=1,
+                    keepalives_idle=30,
+                )
+            return self._pool
+
+    def _check_config(self) -> tuple[str, ...]:
         """Check required configuration"""
-        required_configs = [
-            "REDSHIFT_HOST",
-            "REDSHIFT_DATABASE",
-            "REDSHIFT_USERNAME",
-            "REDSHIFT_PASSWORD",
-        ]
+        return self._missing_configs
 
-        missing_configs = []
-        for config in required_configs:
-            if not hasattr(settings, config) or not getattr(settings, config):
-                missing_configs.append(config)
-
-        return missing_configs
-
-    def _execute_query(self, query: str) -> list[dict[str, Any]]:
-        """Execute SQL query"""
+    def _execute_query(
+        self, query: str, params: tuple | None = None
+    ) -> list[dict[str, Any]]:
+        """Execute SQL query, binding params to %s placeholders"""
         # Check configuration
         missing_configs = self._check_config()
         if missing_configs:
@@ -39,34 +70,19 @@ class RedshiftConnector:
             return self._get_mock_data(query)
 
         try:
-            # Direct connection to Redshift
-            conn = psycopg2.connect(
-                host=settings.REDSHIFT_HOST,
-                port=getattr(settings, "REDSHIFT_PORT", 5439),
-                database=settings.REDSHIFT_DATABASE,
-                user=settings.REDSHIFT_USERNAME,
-                password=settings.REDSHIFT_PASSWORD,
-                connect_timeout=30,
-            )
-
-            cursor = conn.cursor()
-            cursor.execute(query)
-
-            # Get column names
-            columns = [desc[0] for desc in cursor.description]
-
-            # Get data
-            rows = cursor.fetchall()
-
-            # Convert to list of dictionaries
-            results = []
-            for row in rows:
-                results.append(dict(zip(columns, row, strict=False)))
-
-            cursor.close()
-            conn.close()
-
-            return results
+            # Pooled direct connection to Redshift
+            pool = self._get_pool()
+            with self._pool_slots:
+                conn = pool.getconn()
+                try:
+                    # Rows come back as dictionaries keyed by column name
+                    with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                        cursor.execute(query, params)
+                        return cursor.fetchall()
+                finally:
+                    # Discard connections broken during the query, the pool rolls
+                    # back any open transaction on the others
+                    pool.putconn(conn, close=bool(conn.closed))
 
         except Exception as e:
             # Throw exception when real connection fails, no longer return fake data
@@ -118,18 +134,18 @@ class RedshiftConnector:
         """Get table information (including regular and external tables)"""
         if schema_name:
             # Query regular tables
-            regular_tables_query = f"""
+            regular_tables_query = """
             SELECT schemaname, tablename, tableowner, 'regular' as table_type
             FROM pg_tables
-            WHERE schemaname = '{schema_name}'
+            WHERE schemaname = %s
             AND schemaname NOT IN ('information_schema', 'pg_catalog')
             """
 
             # Query external tables (SVV_EXTERNAL_TABLES has no tableowner column, use NULL)
-            external_tables_query = f"""
+            external_tables_query = """
             SELECT schemaname, tablename, NULL as tableowner, 'external' as table_type
             FROM SVV_EXTERNAL_TABLES
-            WHERE schemaname = '{schema_name}'
+            WHERE schemaname = %s
             """
 
             # Merge queries
@@ -139,6 +155,7 @@ class RedshiftConnector:
             {external_tables_query}
             ORDER BY tablename
             """
+            params = (schema_name, schema_name)
         else:
             # Query all regular tables
             regular_tables_query = """
@@ -160,9 +177,10 @@ class RedshiftConnector:
             {external_tables_query}
             ORDER BY schemaname, tablename
             """
+            params = None
 
         try:
-            results = self._execute_query(query)
+            results = self._execute_query(query, params)
             return results
         except Exception as e:
             raise Exception(
@@ -173,7 +191,7 @@ class RedshiftConnector:
         self, schema_name: str, table_name: str
     ) -> list[dict[str, Any]]:
         """Get table column information"""
-        query = f"""
+        query = """
         SELECT
             column_name,
             data_type,
@@ -181,34 +199,70 @@ class RedshiftConnector:
             column_default,
             character_maximum_length
         FROM information_schema.columns
-        WHERE table_schema = '{schema_name}'
-        AND table_name = '{table_name}'
+        WHERE table_schema = %s
+        AND table_name = %s
         ORDER BY ordinal_position
         """
 
         try:
-            results = self._execute_query(query)
+            results = self._execute_query(query, (schema_name, table_name))
             return results
         except Exception as e:
             raise Exception(
                 f"Failed to get column information for table {schema_name}.{table_name}: {str(e)}"
             ) from e
 
+    def get_tables_columns(
+        self, schema_name: str, table_names: Iterable[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get column information for several tables of a schema in one query"""
+        names = tuple(dict.fromkeys(table_names))
+        if not names:
+            return {}
+
+        # psycopg2 expands the tuple parameter into an IN list
+        query = """
+        SELECT
+            table_name,
+            column_name,
+            data_type,
+            is_nullable,
+            column_default,
+            character_maximum_length
+        FROM information_schema.columns
+        WHERE table_schema = %s
+        AND table_name IN %s
+        ORDER BY table_name, ordinal_position
+        """
+
+        try:
+            results = self._execute_query(query, (schema_name, names))
+            return {
+                table_name: list(columns)
+                for table_name, columns in itertools.groupby(
+                    results, key=lambda row: row.get("table_name", "")
+                )
+            }
+        except Exception as e:
+            raise Exception(
+                f"Failed to get column information for tables in schema {schema_name}: {str(e)}"
+            ) from e
+
     def search_tables(self, search_text: str) -> list[dict[str, Any]]:
         """Search for tables containing specified text in table name (including regular and external tables)"""
         # Search regular tables
-        regular_tables_query = f"""
+        regular_tables_query = """
         SELECT schemaname, tablename, tableowner, 'regular' as table_type
         FROM pg_tables
-        WHERE tablename ILIKE '%{search_text}%'
+        WHERE tablename ILIKE %s
         AND schemaname NOT IN ('information_schema', 'pg_catalog')
         """
 
         # Search external tables (SVV_EXTERNAL_TABLES has no tableowner column, use NULL)
-        external_tables_query = f"""
+        external_tables_query = """
         SELECT schemaname, tablename, NULL as tableowner, 'external' as table_type
         FROM SVV_EXTERNAL_TABLES
-        WHERE tablename ILIKE '%{search_text}%'
+        WHERE tablename ILIKE %s
         """
 
         # Merge queries
@@ -219,8 +273,10 @@ class RedshiftConnector:
         ORDER BY schemaname, tablename
         """
 
+        pattern = f"%{search_text}%"
+
         try:
-            results = self._execute_query(query)
+            results = self._execute_query(query, (pattern, pattern))
             return results
         except Exception as e:
             raise Exception(f"Failed to search Redshift tables: {str(e)}") from e
@@ -230,21 +286,23 @@ class RedshiftConnector:
     ) -> list[dict[str, Any]]:
         """Specifically get external table information"""
         if schema_name:
-            query = f"""
+            query = """
             SELECT schemaname, tablename, NULL as tableowner, location
             FROM SVV_EXTERNAL_TABLES
-            WHERE schemaname = '{schema_name}'
+            WHERE schemaname = %s
             ORDER BY tablename
             """
+            params = (schema_name,)
         else:
             query = """
             SELECT schemaname, tablename, NULL as tableowner, location
             FROM SVV_EXTERNAL_TABLES
             ORDER BY schemaname, tablename
             """
+            params = None
 
         try:
-            results = self._execute_query(query)
+            results = self._execute_query(query, params)
             return results
         except Exception as e:
             raise Exception(
@@ -254,12 +312,30 @@ class RedshiftConnector:
     def get_statistics(self) -> dict[str, Any]:
         """Get Redshift statistics"""
         try:
-            schemas = self.get_schemas()
-            total_tables = sum(schema.get("table_count", 0) for schema in schemas)
+            # Count regular and external tables per schema in a single round-trip
+            query = """
+            WITH all_tables AS (
+                SELECT schemaname, 0 as is_external
+                FROM pg_tables
+                WHERE schemaname NOT IN ('information_schema', 'pg_catalog')
+                UNION ALL
+                SELECT schemaname, 1 as is_external
+                FROM SVV_EXTERNAL_TABLES
+            )
+            SELECT
+                schemaname,
+                COUNT(*) as table_count,
+                SUM(is_external) as external_table_count
+            FROM all_tables
+            GROUP BY schemaname
+            ORDER BY schemaname
+            """
+            schemas = self._execute_query(query)
 
-            # Get external table statistics
-            external_tables = self.get_external_tables()
-            total_external_tables = len(external_tables)
+            total_tables = sum(schema.get("table_count", 0) for schema in schemas)
+            total_external_tables = sum(
+                schema.get("external_table_count") or 0 for schema in schemas
+            )
 
             return {
                 "total_schemas": len(schemas),
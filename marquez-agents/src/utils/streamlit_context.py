@@ -2,9 +2,26 @@
 Streamlit Context Manager - Handles Streamlit environment detection and state management
 """
 
+import sys
 import threading
+from collections import deque
+from datetime import datetime
 from typing import Any
 
+# Number of recent tool calls kept for the sidebar history
+TOOL_CALL_HISTORY_SIZE = 5
+
+
+def new_tool_call_history() -> deque:
+    """Create a bounded tool call history"""
+    return deque(maxlen=TOOL_CALL_HISTORY_SIZE)
+
+
+def _get_streamlit():
+    """Get the Streamlit module if the app has loaded it"""
+    # Only the web app imports Streamlit, CLI mode never pays for importing it
+    return sys.modules.get("streamlit")
+
 
 class StreamlitContext:
     """Streamlit Context Manager"""
@@ -14,13 +31,10 @@ class StreamlitContext:
     @classmethod
     def is_streamlit_available(cls) -> bool:
         """Check if running in Streamlit environment"""
-        try:
-            import streamlit as st
+        st = _get_streamlit()
 
-            # Check if there's an active Streamlit session
-            return hasattr(st, "session_state") and st.session_state is not None
-        except Exception:
-            return False
+        # Check if there's an active Streamlit session
+        return st is not None and getattr(st, "session_state", None) is not None
 
     @classmethod
     def safe_session_state_access(cls, key: str, default: Any = None) -> Any:
@@ -29,7 +43,7 @@ class StreamlitContext:
             return default
 
         try:
-            import streamlit as st
+            st = _get_streamlit()
 
             return getattr(st.session_state, key, default)
         except Exception:
@@ -42,7 +56,7 @@ class StreamlitContext:
             return False
 
         try:
-            import streamlit as st
+            st = _get_streamlit()
 
             setattr(st.session_state, key, value)
             return True
@@ -56,12 +70,10 @@ class StreamlitContext:
             return
 
         try:
-            from datetime import datetime
-
-            import streamlit as st
+            st = _get_streamlit()
 
-            if not hasattr(st.session_state, "tool_calls"):
-                st.session_state.tool_calls = []
+            if "tool_calls" not in st.session_state:
+                st.session_state.tool_calls = new_tool_call_history()
 
             st.session_state.current_active_agent = agent_name
             st.session_state.current_thinking = status
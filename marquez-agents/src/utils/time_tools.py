@@ -2,11 +2,49 @@
 Time-related tools - Provide accurate time judgment capabilities for Agents
 """
 
+import functools
+import re
 from datetime import UTC, datetime, timedelta
 
 import pytz
 from strands import tool
 
+# Fallback formats for strings datetime.fromisoformat does not accept
+TIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+)
+
+# Timezone abbreviations stripped before parsing in is_recent
+TIMEZONE_SUFFIX_PATTERN = re.compile(r"\s+(?:UTC|CST|EST|PST)$")
+
+
+@functools.lru_cache(maxsize=64)
+def _get_timezone(timezone_name: str):
+    """Get a pytz timezone, cached per name"""
+    return pytz.timezone(timezone_name)
+
+
+def _parse_time(time_str: str) -> datetime:
+    """Parse a time string into a naive datetime (UTC if an offset was given)"""
+    try:
+        dt = datetime.fromisoformat(time_str)
+    except ValueError:
+        for fmt in TIME_FORMATS:
+            try:
+                return datetime.strptime(time_str, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f"Unable to parse time format: {time_str}") from None
+
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(UTC).replace(tzinfo=None)
+    return dt
+
 
 @tool
 def get_current_time(timezone_name: str = "UTC") -> str:
@@ -20,13 +58,14 @@ def get_current_time(timezone_name: str = "UTC") -> str:
         Formatted current time string
     """
     try:
-        tz = pytz.timezone(timezone_name)
+        tz = _get_timezone(timezone_name)
         current_time = datetime.now(tz)
-        return current_time.strftime("%Y-%m-%d %H:%M:%S %Z")
+        # ISO output with offset round-trips through _parse_time's fromisoformat
+        return current_time.isoformat(sep=" ", timespec="seconds")
     except Exception:
         # If timezone is invalid, return UTC time
         current_time = datetime.now(UTC)
-        return f"{current_time.strftime('%Y-%m-%d %H:%M:%S UTC')} (Note: timezone '{timezone_name}' is invalid, returning UTC time)"
+        return f"{current_time.isoformat(sep=' ', timespec='seconds')} (Note: timezone '{timezone_name}' is invalid, returning UTC time)"
 
 
 @tool
@@ -56,7 +95,7 @@ def format_timestamp(
         Formatted time string
     """
     try:
-        tz = pytz.timezone(timezone_name)
+        tz = _get_timezone(timezone_name)
         dt = datetime.fromtimestamp(timestamp, tz)
         return dt.strftime(f"{format_str} %Z")
     except Exception as e:
@@ -77,25 +116,8 @@ def time_difference(time1: str, time2: str, unit: str = "hours") -> str:
         Time difference description
     """
     try:
-        # Try to parse time strings
-        def parse_time(time_str):
-            formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%d %H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            ]
-            for fmt in formats:
-                try:
-                    return datetime.strptime(time_str, fmt)
-                except ValueError:
-                    continue
-            raise ValueError(f"Unable to parse time format: {time_str}")
-
-        dt1 = parse_time(time1)
-        dt2 = parse_time(time2)
+        dt1 = _parse_time(time1)
+        dt2 = _parse_time(time2)
         diff = abs((dt2 - dt1).total_seconds())
 
         if unit == "seconds":
@@ -126,25 +148,8 @@ def is_time_before(time1: str, time2: str) -> str:
         Comparison result description
     """
     try:
-
-        def parse_time(time_str):
-            formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%d %H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            ]
-            for fmt in formats:
-                try:
-                    return datetime.strptime(time_str, fmt)
-                except ValueError:
-                    continue
-            raise ValueError(f"Unable to parse time format: {time_str}")
-
-        dt1 = parse_time(time1)
-        dt2 = parse_time(time2)
+        dt1 = _parse_time(time1)
+        dt2 = _parse_time(time2)
 
         if dt1 < dt2:
             return f"Yes, {time1} is before {time2}"
@@ -173,7 +178,7 @@ def get_time_ago(hours: int = 0, days: int = 0, minutes: int = 0) -> str:
     try:
         now = datetime.now(UTC)
         past_time = now - timedelta(days=days, hours=hours, minutes=minutes)
-        return past_time.strftime("%Y-%m-%d %H:%M:%S UTC")
+        return past_time.isoformat(sep=" ", timespec="seconds")
     except Exception as e:
         return f"Failed to calculate past time: {str(e)}"
 
@@ -191,32 +196,10 @@ def is_recent(timestamp_str: str, threshold_hours: int = 24) -> str:
         Judgment result description
     """
     try:
+        # Try to remove timezone identifiers before parsing
+        time_str_clean = TIMEZONE_SUFFIX_PATTERN.sub("", timestamp_str)
 
-        def parse_time(time_str):
-            # Try to remove timezone identifiers before parsing
-            time_str_clean = (
-                time_str.replace(" UTC", "")
-                .replace(" CST", "")
-                .replace(" EST", "")
-                .replace(" PST", "")
-            )
-
-            formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%d %H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            ]
-            for fmt in formats:
-                try:
-                    return datetime.strptime(time_str_clean, fmt)
-                except ValueError:
-                    continue
-            raise ValueError(f"Unable to parse time format: {time_str}")
-
-        target_time = parse_time(timestamp_str)
+        target_time = _parse_time(time_str_clean)
         now = datetime.now(UTC)
 
         # If target time has no timezone info, assume UTC
@@ -0,0 +1,72 @@
+"""
+TTL Cache - Memoize function results for a limited time
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+def ttl_cache(ttl_seconds: float, maxsize: int = 128):
+    """Decorator caching results per arguments for ttl_seconds
+
+    Concurrent calls with the same arguments share a single invocation.
+    Exceptions are not cached. The wrapped function gains a cache_clear()
+    method to drop all entries.
+    """
+
+    def decorator(func):
+        entries: OrderedDict = OrderedDict()
+        inflight: dict = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(key)
+                    return entry[1]
+
+                # Wait for an identical call already in progress instead of repeating it
+                future = inflight.get(key)
+                if future is None:
+                    future = inflight[key] = Future()
+                    is_leader = True
+                else:
+                    is_leader = False
+
+            if not is_leader:
+                return future.result()
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    del inflight[key]
+                future.set_exception(e)
+                raise
+
+            with lock:
+                del inflight[key]
+                entries[key] = (now + ttl_seconds, result)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+
+            future.set_result(result)
+            return result
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -11,6 +11,38 @@ from pathlib import Path
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# Environment variables the server process needs; MARQUEZ_* configures its settings
+SERVER_ENV_VARS = (
+    "PATH",
+    "PYTHONPATH",
+    "VIRTUAL_ENV",
+    "HOME",
+    "USER",
+    "LANG",
+    "LC_ALL",
+    # Proxy and CA settings for reaching Marquez from corporate networks
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "NO_PROXY",
+    "http_proxy",
+    "https_proxy",
+    "no_proxy",
+    "SSL_CERT_FILE",
+    "REQUESTS_CA_BUNDLE",
+)
+SERVER_ENV_PREFIXES = ("MARQUEZ_",)
+
+
+def get_server_env():
+    """Get the subset of the environment passed to the server process"""
+    env = {name: os.environ[name] for name in SERVER_ENV_VARS if name in os.environ}
+    env.update(
+        (name, value)
+        for name, value in os.environ.items()
+        if name.startswith(SERVER_ENV_PREFIXES)
+    )
+    return env
+
 
 async def test_mcp_server():
     """Test MCP server connection and basic functionality"""
@@ -24,7 +56,7 @@ async def test_mcp_server():
 
     # Define server parameters
     server_params = StdioServerParameters(
-        command=python_exe, args=[str(server_script)], env=dict(os.environ)
+        command=python_exe, args=[str(server_script)], env=get_server_env()
     )
 
     try:
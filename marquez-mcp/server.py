@@ -1,5 +1,13 @@
 import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import quote
 
 import httpx
 import yaml
@@ -7,6 +15,12 @@ from fastmcp import FastMCP
 from fastmcp.server.openapi import MCPType, RouteMap
 from settings import settings
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -14,6 +28,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Bump whenever fix_openapi_spec changes so cached copies fixed the old way are ignored
+SPEC_FIX_VERSION = 1
+
+# Private per-user directory holding fixed spec copies
+SPEC_CACHE_DIR = Path.home() / ".cache" / "marquez-mcp"
+
+
 def fix_openapi_spec(spec):
     """Fix common OpenAPI spec issues for FastMCP compatibility and disable output validation"""
     if not isinstance(spec, dict):
@@ -21,50 +42,110 @@ def fix_openapi_spec(spec):
 
     # Fix response codes - they should be strings, not integers
     # Also remove response schemas to disable output validation
-    if "paths" in spec:
-        for path_data in spec["paths"].values():
-            if isinstance(path_data, dict):
-                for method_data in path_data.values():
-                    if isinstance(method_data, dict) and "responses" in method_data:
-                        responses = method_data["responses"]
-                        if isinstance(responses, dict):
-                            # Convert integer response codes to strings and remove schemas
-                            fixed_responses = {}
-                            for code, response_data in responses.items():
-                                if isinstance(response_data, dict):
-                                    # Keep only description, remove schema/content for validation bypass
-                                    fixed_response = {
-                                        "description": response_data.get(
-                                            "description", "Response"
-                                        )
-                                    }
-                                    fixed_responses[str(code)] = fixed_response
-                                else:
-                                    fixed_responses[str(code)] = response_data
-                            method_data["responses"] = fixed_responses
+    for path_data in (spec.get("paths") or {}).values():
+        if not isinstance(path_data, dict):
+            continue
+        # Path items also hold non-operation entries such as parameters lists
+        for method_data in path_data.values():
+            responses = (
+                method_data.get("responses") if isinstance(method_data, dict) else None
+            )
+            if not isinstance(responses, dict):
+                continue
+
+            # Convert integer response codes to strings and remove schemas
+            for code, response_data in list(responses.items()):
+                is_dict = isinstance(response_data, dict)
+                # Leave already conformant responses untouched
+                if isinstance(code, str) and (
+                    not is_dict or response_data.keys() == {"description"}
+                ):
+                    continue
+
+                del responses[code]
+                if is_dict:
+                    # Keep only description, remove schema/content for validation bypass
+                    responses[str(code)] = {
+                        "description": response_data.get("description", "Response")
+                    }
+                else:
+                    responses[str(code)] = response_data
 
     return spec
 
 
+def get_spec_cache_path():
+    """Get the file caching the fixed spec, None if the cache directory is unsafe"""
+    try:
+        SPEC_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        dir_stat = SPEC_CACHE_DIR.stat()
+    except OSError as e:
+        logger.warning("⚠️ Unable to create OpenAPI cache directory: %s", e)
+        return None
+    # Only trust a directory no other user can write into
+    if dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077:
+        logger.warning(
+            "⚠️ OpenAPI cache directory %s is not private, not caching", SPEC_CACHE_DIR
+        )
+        return None
+
+    # Keyed by the spec URL and the fix logic that produced the copy
+    cache_key = f"v{SPEC_FIX_VERSION}:{settings.MARQUEZ_OPENAPI_URL}"
+    key_hash = hashlib.sha256(cache_key.encode()).hexdigest()
+    return SPEC_CACHE_DIR / f"openapi-{key_hash[:16]}.fixed.json"
+
+
+def read_cached_spec(cache_path, ttl_seconds):
+    """Read the cached fixed spec, None if missing, expired or unreadable"""
+    try:
+        if time.time() - cache_path.stat().st_mtime > ttl_seconds:
+            return None
+        return json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_cached_spec(cache_path, spec):
+    """Write the fixed spec to the cache file, ignoring failures"""
+    try:
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(spec), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("⚠️ Unable to cache OpenAPI specification: %s", e)
+
+
 async def load_openapi_spec():
     """Load OpenAPI spec with proper error handling"""
+    # The spec rarely changes, restarts reuse the already fixed copy
+    cache_ttl = settings.get("MARQUEZ_OPENAPI_CACHE_TTL", 0)
+    cache_path = get_spec_cache_path() if cache_ttl > 0 else None
+    if cache_path is not None:
+        cached_spec = read_cached_spec(cache_path, cache_ttl)
+        if cached_spec is not None:
+            logger.info("📦 Using cached OpenAPI specification: %s", cache_path)
+            return cached_spec
+
     try:
-        logger.info(f"🔄 Loading OpenAPI specification: {settings.MARQUEZ_OPENAPI_URL}")
+        logger.info(
+            "🔄 Loading OpenAPI specification: %s", settings.MARQUEZ_OPENAPI_URL
+        )
 
         async with httpx.AsyncClient() as client:
             response = await client.get(settings.MARQUEZ_OPENAPI_URL)
             response.raise_for_status()
 
             logger.info(
-                f"✅ OpenAPI specification loaded successfully, status code: {response.status_code}"
+                "✅ OpenAPI specification loaded successfully, status code: %s",
+                response.status_code,
             )
 
             # Check if it's YAML or JSON based on content type or URL
-            content = response.text
-            if settings.MARQUEZ_OPENAPI_URL.endswith(
-                ".yml"
-            ) or settings.MARQUEZ_OPENAPI_URL.endswith(".yaml"):
-                spec = yaml.safe_load(content)
+            content_type = response.headers.get("content-type", "").lower()
+            if "yaml" in content_type or settings.MARQUEZ_OPENAPI_URL.endswith(
+                (".yml", ".yaml")
+            ):
+                spec = yaml.load(response.text, Loader=YamlLoader)
                 logger.info("📋 Parsed as YAML format")
             else:
                 spec = response.json()
@@ -73,97 +154,192 @@ async def load_openapi_spec():
             # Fix common compatibility issues
             fixed_spec = fix_openapi_spec(spec)
             logger.info("🔧 OpenAPI specification fix completed")
+
+            if cache_path is not None:
+                write_cached_spec(cache_path, fixed_spec)
             return fixed_spec
 
     except httpx.RequestError as e:
-        logger.error(f"❌ Failed to fetch OpenAPI specification: {e}")
+        logger.error("❌ Failed to fetch OpenAPI specification: %s", e)
         raise RuntimeError(f"Failed to fetch OpenAPI spec: {e}")
     except (yaml.YAMLError, ValueError) as e:
-        logger.error(f"❌ Failed to parse OpenAPI specification: {e}")
+        logger.error("❌ Failed to parse OpenAPI specification: %s", e)
         raise RuntimeError(f"Failed to parse OpenAPI spec: {e}")
     except Exception as e:
-        logger.error(f"❌ Error processing OpenAPI specification: {e}")
+        logger.error("❌ Error processing OpenAPI specification: %s", e)
         raise RuntimeError(f"Failed to parse OpenAPI spec: {e}")
 
 
+# Keep enough idle connections for the concurrent per-namespace dataset listing
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=100)
+HTTP_TIMEOUT = 30.0
+
+# Longest response body logged, larger lineage payloads are truncated
+LOG_BODY_LIMIT = 4096
+
+# Recently logged response bodies remembered to skip logging repeats
+LOGGED_BODY_CACHE_SIZE = 128
+
+
 class LoggingHTTPClient:
     """HTTP client wrapper for logging requests and responses"""
 
-    def __init__(self, base_url=None):
-        self.client = httpx.AsyncClient(base_url=base_url)
+    def __init__(self, base_url=None, client=None):
+        self.client = client or httpx.AsyncClient(
+            base_url=base_url, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+        )
+        # (method, url, body hash) -> times the same response was seen again
+        self._logged_bodies = OrderedDict()
 
     async def request(self, method, url, **kwargs):
         """Send HTTP request and log detailed information"""
-        # Log request information
-        full_url = (
-            str(self.client.base_url) + str(url) if self.client.base_url else str(url)
-        )
-        logger.info(f"🚀 Sending request: {method.upper()} {full_url}")
-
-        # Log request parameters
-        if kwargs.get("params"):
-            logger.info(f"📋 Query parameters: {kwargs['params']}")
-        if kwargs.get("json"):
-            logger.info(f"📦 Request body (JSON): {kwargs['json']}")
-        if kwargs.get("data"):
-            logger.info(f"📦 Request body (Data): {kwargs['data']}")
-        if kwargs.get("headers"):
-            logger.info(f"📋 Request headers: {kwargs['headers']}")
+        # Check levels once per call, skipping log preparation when disabled
+        log_info = logger.isEnabledFor(logging.INFO)
+        # Bodies and headers can be large, only log them when debugging
+        log_details = logger.isEnabledFor(logging.DEBUG)
+
+        if log_info:
+            # Log request information
+            full_url = (
+                str(self.client.base_url) + str(url)
+                if self.client.base_url
+                else str(url)
+            )
+            logger.info("🚀 Sending request: %s %s", method.upper(), full_url)
+
+            # Log request parameters
+            if kwargs.get("params"):
+                logger.info("📋 Query parameters: %s", kwargs["params"])
+        if log_details:
+            if kwargs.get("json"):
+                logger.debug("📦 Request body (JSON): %s", kwargs["json"])
+            if kwargs.get("data"):
+                logger.debug("📦 Request body (Data): %s", kwargs["data"])
+            if kwargs.get("headers"):
+                logger.debug("📋 Request headers: %s", kwargs["headers"])
 
         try:
             # Send request
             response = await self.client.request(method, url, **kwargs)
 
             # Log response information
-            logger.info(f"✅ Response status: {response.status_code}")
-            logger.info(f"📋 Response headers: {dict(response.headers)}")
-
-            # Log response content
-            try:
-                response_text = response.text
-                if response_text:
-                    # Try to parse as JSON for formatted output
-                    try:
-                        import json
-
-                        response_json = response.json()
-                        logger.info(
-                            f"📄 Response content (JSON): {json.dumps(response_json, indent=2, ensure_ascii=False)}"
+            if log_info:
+                logger.info("✅ Response status: %s", response.status_code)
+
+            if log_details:
+                logger.debug("📋 Response headers: %s", dict(response.headers))
+
+                # Log response content, decoding the body only once
+                try:
+                    body = response.content
+                    body_key = (method.upper(), str(url), hash(body))
+                    if body and body_key in self._logged_bodies:
+                        # Polling the same endpoint, do not log the payload again
+                        self._logged_bodies[body_key] += 1
+                        self._logged_bodies.move_to_end(body_key)
+                        logger.debug(
+                            "📄 Response content: same as previous (repeated %s times)",
+                            self._logged_bodies[body_key],
                         )
-                    except Exception:
-                        # If not JSON, output text directly
-                        logger.info(f"📄 Response content (Text): {response_text}")
-                else:
-                    logger.info("📄 Response content: (empty)")
-            except Exception as e:
-                logger.warning(f"⚠️ Unable to read response content: {e}")
+                    elif body:
+                        self._logged_bodies[body_key] = 0
+                        if len(self._logged_bodies) > LOGGED_BODY_CACHE_SIZE:
+                            self._logged_bodies.popitem(last=False)
+
+                        # Try to parse as JSON for formatted output
+                        try:
+                            kind = "JSON"
+                            content = json.dumps(
+                                json.loads(body), indent=2, ensure_ascii=False
+                            )
+                        except ValueError:
+                            # If not JSON, output text directly
+                            kind = "Text"
+                            content = body.decode(
+                                response.encoding or "utf-8", "replace"
+                            )
+                        if len(content) > LOG_BODY_LIMIT:
+                            content = (
+                                f"{content[:LOG_BODY_LIMIT]}... ({len(content)} chars)"
+                            )
+                        logger.debug("📄 Response content (%s): %s", kind, content)
+                    else:
+                        logger.debug("📄 Response content: (empty)")
+                except Exception as e:
+                    logger.warning("⚠️ Unable to read response content: %s", e)
 
             return response
 
         except Exception as e:
-            logger.error(f"❌ Request failed: {e}")
+            logger.error("❌ Request failed: %s", e)
             raise
 
-    async def get(self, url, **kwargs):
-        return await self.request("GET", url, **kwargs)
+    # Verb helpers forwarding to request(), bound without an extra Python frame
+    get = functools.partialmethod(request, "GET")
+    post = functools.partialmethod(request, "POST")
+    put = functools.partialmethod(request, "PUT")
+    delete = functools.partialmethod(request, "DELETE")
+    patch = functools.partialmethod(request, "PATCH")
+    head = functools.partialmethod(request, "HEAD")
+    options = functools.partialmethod(request, "OPTIONS")
 
-    async def post(self, url, **kwargs):
-        return await self.request("POST", url, **kwargs)
 
-    async def put(self, url, **kwargs):
-        return await self.request("PUT", url, **kwargs)
+# Page size used when enumerating Marquez namespaces and datasets
+DATASET_PAGE_SIZE = 100
 
-    async def delete(self, url, **kwargs):
-        return await self.request("DELETE", url, **kwargs)
+# Namespaces whose datasets are fetched at the same time
+NAMESPACE_FETCH_CONCURRENCY = 8
 
-    async def patch(self, url, **kwargs):
-        return await self.request("PATCH", url, **kwargs)
+# Datasets listed in one list_all_datasets_by_namespace response, the rest are counted
+MAX_LISTED_DATASETS = 500
 
-    async def head(self, url, **kwargs):
-        return await self.request("HEAD", url, **kwargs)
 
-    async def options(self, url, **kwargs):
-        return await self.request("OPTIONS", url, **kwargs)
+async def list_namespaces(client):
+    """List all namespace names, following offset pagination"""
+    namespaces = []
+    offset = 0
+    while True:
+        response = await client.get(
+            "/namespaces", params={"limit": DATASET_PAGE_SIZE, "offset": offset}
+        )
+        response.raise_for_status()
+        page = response.json().get("namespaces", [])
+        namespaces.extend(namespace["name"] for namespace in page)
+        if len(page) < DATASET_PAGE_SIZE:
+            return namespaces
+        offset += DATASET_PAGE_SIZE
+
+
+async def list_namespace_datasets(client, namespace, max_datasets=None):
+    """List datasets of a namespace, following offset pagination
+
+    Stops once max_datasets are read and returns them with the namespace's total
+    dataset count.
+    """
+    datasets = []
+    offset = 0
+    while True:
+        response = await client.get(
+            f"/namespaces/{quote(namespace, safe='')}/datasets",
+            params={"limit": DATASET_PAGE_SIZE, "offset": offset},
+        )
+        response.raise_for_status()
+        data = response.json()
+        page = data.get("datasets", [])
+        datasets.extend(
+            {
+                "name": dataset.get("name"),
+                "physicalName": dataset.get("physicalName"),
+                "type": dataset.get("type"),
+                "updatedAt": dataset.get("updatedAt"),
+            }
+            for dataset in page
+        )
+        offset += len(page)
+        if len(page) < DATASET_PAGE_SIZE:
+            return datasets, offset
+        if max_datasets is not None and len(datasets) >= max_datasets:
+            return datasets[:max_datasets], data.get("totalCount", offset)
 
 
 async def create_server():
@@ -187,6 +363,45 @@ async def create_server():
         port=8000,
     )
 
+    @mcp.tool
+    async def list_all_datasets_by_namespace() -> dict:
+        """List the datasets of every Marquez namespace in one call.
+
+        Use this instead of listing namespaces and then querying each namespace's
+        datasets one by one. Returns "namespaces", a mapping of namespace name to
+        its "datasetCount" and "datasets" (name, physicalName, type, updatedAt),
+        plus "totalDatasets". At most MAX_LISTED_DATASETS datasets are listed;
+        when "truncated" is true, query the remaining namespaces' datasets
+        directly.
+        """
+        namespaces = await list_namespaces(client)
+        semaphore = asyncio.Semaphore(NAMESPACE_FETCH_CONCURRENCY)
+
+        async def fetch(namespace):
+            async with semaphore:
+                return await list_namespace_datasets(
+                    client, namespace, max_datasets=MAX_LISTED_DATASETS
+                )
+
+        results = await asyncio.gather(*(fetch(namespace) for namespace in namespaces))
+
+        # Keep the response bounded, later namespaces only report their counts
+        remaining = MAX_LISTED_DATASETS
+        listing = {}
+        for namespace, (datasets, count) in zip(namespaces, results, strict=True):
+            listing[namespace] = {
+                "datasetCount": count,
+                "datasets": datasets[:remaining],
+            }
+            remaining -= len(listing[namespace]["datasets"])
+
+        total = sum(count for _, count in results)
+        return {
+            "namespaces": listing,
+            "totalDatasets": total,
+            "truncated": total > MAX_LISTED_DATASETS,
+        }
+
     # @mcp.custom_route("/", methods=["GET"])
     # async def liveness(request: Request) -> JSONResponse:
     #     return JSONResponse({"status": "alive"}, status_code=200)
@@ -194,19 +409,24 @@ async def create_server():
     return mcp
 
 
-if __name__ == "__main__":
-    transport = settings.TRANSPORT
-    # transport = "stdio"
-
-    logger.info("🚀 Starting Marquez MCP server...")
-    server = asyncio.run(create_server())
+async def main(transport):
+    """Create and run the MCP server on a single event loop"""
+    server = await create_server()
 
     if transport == "stdio":
         logger.info("📡 Running server with stdio transport")
-        server.run(transport="stdio")
+        await server.run_async(transport="stdio")
     elif transport == "streamable-http":
         logger.info("🌐 Running server with Streamable HTTP transport (0.0.0.0:8000)")
-        server.run(transport="streamable-http")
+        await server.run_async(transport="streamable-http")
     else:
-        logger.error(f"❌ Unknown transport method: {transport}")
+        logger.error("❌ Unknown transport method: %s", transport)
         raise ValueError(f"Unknown transport: {transport}")
+
+
+if __name__ == "__main__":
+    transport = settings.TRANSPORT
+    # transport = "stdio"
+
+    logger.info("🚀 Starting Marquez MCP server...")
+    asyncio.run(main(transport))
@@ -4,19 +4,57 @@ Iceberg to Redshift Lineage Converter
 """
 
 import argparse
+import itertools
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 from urllib.parse import quote
 
 import boto3
+import orjson
 import psycopg2
 import requests
 import yaml
+from botocore.config import Config
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 load_dotenv()
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Concurrent table lineage creations, each is dominated by Glue/Marquez I/O
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 4) * 4)
+
+# Largest page GetTables returns
+GLUE_PAGE_SIZE = 100
+
+# Marquez connections kept alive, enough for every worker thread
+HTTP_POOL_SIZE = 32
+# (connect, read) timeout in seconds for Marquez requests
+HTTP_TIMEOUT = (3.05, 30)
+
+# OpenLineage event producer and facet schemas
+PRODUCER = "iceberg_lineage_converter"
+OPENLINEAGE_FACETS_URL = "https://openlineage.io/spec/facets/1-0-0/"
+COLUMN_LINEAGE_JOB_FACET_URL = f"{OPENLINEAGE_FACETS_URL}ColumnLineageJobFacet.json"
+COLUMN_LINEAGE_DATASET_FACET_URL = (
+    f"{OPENLINEAGE_FACETS_URL}ColumnLineageDatasetFacet.json"
+)
+SCHEMA_DATASET_FACET_URL = f"{OPENLINEAGE_FACETS_URL}SchemaDatasetFacet.json"
+
+# Lineage event times are reported in Beijing time (UTC+8)
+BEIJING_TZ = timezone(timedelta(hours=8))
+
+# Column lineage transformation recorded for every Glue to Redshift column
+DIRECT_MAPPING_DESCRIPTION = "Direct mapping from Glue table to Redshift external table"
+
 
 class RedshiftConnector:
     """Redshift Connector"""
@@ -26,7 +64,10 @@ class RedshiftConnector:
         self.connection = None
 
     def connect(self):
-        """Connect to Redshift"""
+        """Connect to Redshift, reusing the open connection"""
+        if self.connection is not None and not self.connection.closed:
+            return
+
         self.connection = psycopg2.connect(
             host=self.config["host"],
             port=self.config["port"],
@@ -40,20 +81,25 @@ class RedshiftConnector:
         self, schema_name: str, glue_database: str, iam_role: str
     ) -> str:
         """Create external schema"""
-        ddl = f"""CREATE EXTERNAL SCHEMA {schema_name}
+        cursor = self.connection.cursor()
+        try:
+            # Re-runs are the common case, a catalog read is cheaper than a
+            # failing DDL and its rollback
+            cursor.execute(
+                "SELECT 1 FROM SVV_EXTERNAL_SCHEMAS WHERE schemaname = %s",
+                (schema_name,),
+            )
+            if cursor.fetchone():
+                return f"-- Schema {schema_name} already exists"
+
+            ddl = f"""CREATE EXTERNAL SCHEMA IF NOT EXISTS {schema_name}
 FROM DATA CATALOG
 DATABASE '{glue_database}'
 IAM_ROLE '{iam_role}';"""
-
-        try:
-            cursor = self.connection.cursor()
             cursor.execute(ddl)
-            cursor.close()
             return ddl
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                return f"-- Schema {schema_name} already exists"
-            raise
+        finally:
+            cursor.close()
 
     def list_tables(self, schema_name: str) -> List[str]:
         """List tables in schema"""
@@ -82,23 +128,30 @@ class GlueMetadataExtractor:
         session = (
             boto3.Session(profile_name=aws_profile) if aws_profile else boto3.Session()
         )
-        self.glue_client = session.client("glue")
+        # Adaptive retries absorb Glue throttling without failing the listing
+        self.glue_client = session.client(
+            "glue", config=Config(retries={"max_attempts": 5, "mode": "adaptive"})
+        )
 
-    def list_tables(self, database: str) -> List[str]:
-        """List all tables in Glue database"""
-        tables = []
+    def iter_table_metadata(self, database: str) -> Iterator[Dict[str, Any]]:
+        """Yield metadata of all tables in Glue database as pages arrive"""
         paginator = self.glue_client.get_paginator("get_tables")
 
-        for page in paginator.paginate(DatabaseName=database):
+        # GetTables already returns full table definitions, no per-table GetTable
+        for page in paginator.paginate(
+            DatabaseName=database, PaginationConfig={"PageSize": GLUE_PAGE_SIZE}
+        ):
             for table in page["TableList"]:
-                tables.append(table["Name"])
-
-        return tables
+                yield self._to_table_metadata(table)
 
     def get_table_metadata(self, database: str, table: str) -> Dict[str, Any]:
         """Get table metadata"""
         response = self.glue_client.get_table(DatabaseName=database, Name=table)
-        table_info = response["Table"]
+        return self._to_table_metadata(response["Table"])
+
+    @staticmethod
+    def _to_table_metadata(table_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a Glue table definition into table metadata"""
         storage = table_info.get("StorageDescriptor", {})
 
         return {
@@ -117,27 +170,24 @@ class GlueMetadataExtractor:
             ],
         }
 
-    def extract_namespace(self, metadata: Dict[str, Any]) -> str:
-        """Extract namespace from S3 location"""
+    def extract_namespace_and_dataset(
+        self, metadata: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """Extract namespace (bucket) and dataset name (path) from S3 location"""
         location = metadata.get("location", "")
-        if location.startswith("s3://"):
-            parts = location.split("/")
-            if len(parts) >= 3 and parts[2]:
-                return f"s3://{parts[2]}"
+        if not location.startswith("s3://"):
+            raise ValueError(f"Unable to extract namespace from metadata: {location}")
 
-        raise ValueError(f"Unable to extract namespace from metadata: {location}")
+        # Split the location only once for both parts
+        bucket, _, dataset_path = location.removeprefix("s3://").partition("/")
+        if not bucket:
+            raise ValueError(f"Unable to extract namespace from metadata: {location}")
 
-    def extract_dataset(self, metadata: Dict[str, Any]) -> str:
-        """Extract dataset name from S3 path"""
-        location = metadata.get("location", "")
-        if location.startswith("s3://"):
-            parts = location.split("/")
-            if len(parts) > 3:
-                dataset_path = "/".join(parts[3:]).rstrip("/")
-                if dataset_path:
-                    return dataset_path.replace(".", "_")
+        dataset_path = dataset_path.rstrip("/")
+        if not dataset_path:
+            raise ValueError(f"Unable to extract dataset from metadata: {location}")
 
-        raise ValueError(f"Unable to extract dataset from metadata: {location}")
+        return f"s3://{bucket}", dataset_path.replace(".", "_")
 
 
 class MarquezLineageClient:
@@ -146,11 +196,24 @@ class MarquezLineageClient:
     def __init__(self, base_url: str, api_key: str = None):
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
+        # Reuse connections across worker threads and retry transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         if api_key:
             self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+        # Bodies are sent pre-serialized with orjson, so the session sets the type
         self.session.headers.update(
             {"Content-Type": "application/json", "Accept": "application/json"}
         )
+        # Sources already created in this run, shared by every dataset
+        self._sources_created: set[str] = set()
 
     def create_source(
         self, source_name: str, connection_url: str, description: str = None
@@ -164,7 +227,9 @@ class MarquezLineageClient:
             payload["description"] = description
 
         try:
-            response = self.session.put(url, json=payload)
+            response = self.session.put(
+                url, data=orjson.dumps(payload), timeout=HTTP_TIMEOUT
+            )
             response.raise_for_status()
             print(f"✅ Data source created successfully: {source_name}")
             return True
@@ -201,11 +266,13 @@ class MarquezLineageClient:
             fields: Field list [{"name": "field1", "type": "INTEGER"}, ...]
             description: Description
         """
-        # Ensure data source exists
-        if source_name and not self.create_source(
-            source_name, namespace, f"{source_name} data source"
-        ):
-            raise ValueError(f"Unable to create data source: {source_name}")
+        # Ensure data source exists, once per run
+        if source_name and source_name not in self._sources_created:
+            if not self.create_source(
+                source_name, namespace, f"{source_name} data source"
+            ):
+                raise ValueError(f"Unable to create data source: {source_name}")
+            self._sources_created.add(source_name)
 
         # URL encode namespace and dataset name
         encoded_namespace = quote(namespace, safe="")
@@ -228,7 +295,9 @@ class MarquezLineageClient:
             payload["description"] = description
 
         try:
-            response = self.session.put(url, json=payload)
+            response = self.session.put(
+                url, data=orjson.dumps(payload), timeout=HTTP_TIMEOUT
+            )
             response.raise_for_status()
 
             print(f"✅ Dataset created successfully: {namespace}.{dataset_name}")
@@ -250,13 +319,25 @@ class MarquezLineageClient:
         source_fields: List[Dict],
         target_fields: List[Dict],
         column_lineage: List[Dict],
+        run_id: str = None,
+        event_time: str = None,
     ) -> Dict[str, Any]:
-        """Send lineage event"""
-        # Use Beijing time (UTC+8)
-        beijing_tz = timezone(timedelta(hours=8))
-        beijing_now = datetime.now(beijing_tz)
-        run_id = f"run_{int(beijing_now.timestamp())}"
-        event_time = beijing_now.isoformat()
+        """Send lineage event, run_id and event_time default to the current time"""
+        if run_id is None or event_time is None:
+            # Use Beijing time (UTC+8)
+            beijing_now = datetime.now(BEIJING_TZ)
+            run_id = run_id or f"run_{int(beijing_now.timestamp())}"
+            event_time = event_time or beijing_now.isoformat()
+
+        # Shared by the job and output dataset facets
+        column_lineage_fields = {
+            field["name"]: {
+                "inputFields": field["inputFields"],
+                "transformationDescription": field.get("transformationDescription", ""),
+                "transformationType": field.get("transformationType", "IDENTITY"),
+            }
+            for field in column_lineage
+        }
 
         # Build event
         event = {
@@ -268,23 +349,9 @@ class MarquezLineageClient:
                 "name": job_name,
                 "facets": {
                     "columnLineage": {
-                        "_producer": "iceberg_lineage_converter",
-                        "_schemaURL": (
-                            "https://openlineage.io/spec/facets/1-0-0/"
-                            "ColumnLineageJobFacet.json"
-                        ),
-                        "fields": {
-                            field["name"]: {
-                                "inputFields": field["inputFields"],
-                                "transformationDescription": field.get(
-                                    "transformationDescription", ""
-                                ),
-                                "transformationType": field.get(
-                                    "transformationType", "IDENTITY"
-                                ),
-                            }
-                            for field in column_lineage
-                        },
+                        "_producer": PRODUCER,
+                        "_schemaURL": COLUMN_LINEAGE_JOB_FACET_URL,
+                        "fields": column_lineage_fields,
                     }
                 },
             },
@@ -294,11 +361,8 @@ class MarquezLineageClient:
                     "name": source_dataset,
                     "facets": {
                         "schema": {
-                            "_producer": "iceberg_lineage_converter",
-                            "_schemaURL": (
-                                "https://openlineage.io/spec/facets/1-0-0/"
-                                "SchemaDatasetFacet.json"
-                            ),
+                            "_producer": PRODUCER,
+                            "_schemaURL": SCHEMA_DATASET_FACET_URL,
                             "fields": source_fields,
                         }
                     },
@@ -310,41 +374,26 @@ class MarquezLineageClient:
                     "name": target_dataset,
                     "facets": {
                         "schema": {
-                            "_producer": "iceberg_lineage_converter",
-                            "_schemaURL": (
-                                "https://openlineage.io/spec/facets/1-0-0/"
-                                "SchemaDatasetFacet.json"
-                            ),
+                            "_producer": PRODUCER,
+                            "_schemaURL": SCHEMA_DATASET_FACET_URL,
                             "fields": target_fields,
                         },
                         "columnLineage": {
-                            "_producer": "iceberg_lineage_converter",
-                            "_schemaURL": (
-                                "https://openlineage.io/spec/facets/1-0-0/"
-                                "ColumnLineageDatasetFacet.json"
-                            ),
-                            "fields": {
-                                field["name"]: {
-                                    "inputFields": field["inputFields"],
-                                    "transformationDescription": field.get(
-                                        "transformationDescription", ""
-                                    ),
-                                    "transformationType": field.get(
-                                        "transformationType", "IDENTITY"
-                                    ),
-                                }
-                                for field in column_lineage
-                            },
+                            "_producer": PRODUCER,
+                            "_schemaURL": COLUMN_LINEAGE_DATASET_FACET_URL,
+                            "fields": column_lineage_fields,
                         },
                     },
                 }
             ],
-            "producer": "iceberg_lineage_converter",
+            "producer": PRODUCER,
         }
 
         # Send event
         url = f"{self.base_url}/api/v1/lineage"
-        response = self.session.post(url, json=event)
+        response = self.session.post(
+            url, data=orjson.dumps(event), timeout=HTTP_TIMEOUT
+        )
         response.raise_for_status()
 
         return response.json() if response.text else {"status": "success"}
@@ -353,14 +402,22 @@ class MarquezLineageClient:
 class IcebergLineageConverter:
     """Iceberg Lineage Converter"""
 
-    def __init__(self, redshift_config: dict, aws_profile: str = None):
+    def __init__(
+        self,
+        redshift_config: dict,
+        aws_profile: str = None,
+        max_workers: int = DEFAULT_WORKERS,
+    ):
         self.redshift = RedshiftConnector(redshift_config)
         self.glue = GlueMetadataExtractor(aws_profile)
         self.marquez = None
+        self.max_workers = max_workers
 
     def setup_marquez(self, marquez_url: str, api_key: str = None):
         """Setup Marquez client"""
-        self.marquez = MarquezLineageClient(marquez_url, api_key)
+        # Keep the client, and its connections and created sources, across databases
+        if self.marquez is None or self.marquez.base_url != marquez_url.rstrip("/"):
+            self.marquez = MarquezLineageClient(marquez_url, api_key)
 
     def create_schema_and_lineage(
         self,
@@ -371,95 +428,96 @@ class IcebergLineageConverter:
         marquez_api_key: str = None,
     ):
         """Create schema and lineage relationships"""
-        # Get Glue table list (as source)
-        glue_tables = self.glue.list_tables(glue_database)
-        print(
-            f"📊 Found {len(glue_tables)} tables in Glue database {glue_database}: "
-            f"{', '.join(glue_tables)}"
-        )
+        # Get Glue table metadata (as source), streamed page by page
+        print(f"📊 Reading tables from Glue database {glue_database}")
+        glue_tables = self.glue.iter_table_metadata(glue_database)
+        first_table = next(glue_tables, None)
 
-        if not glue_tables:
+        if first_table is None:
             print("⚠️  No Glue tables found, exiting")
             return
 
-        # Connect to Redshift
+        # Connect to Redshift (the connection is shared by all databases)
         self.redshift.connect()
 
-        try:
-            # Create external schema
-            ddl = self.redshift.create_external_schema(
-                redshift_schema, glue_database, iam_role
-            )
-            print(f"\n=== Executed DDL ===\n{ddl}")
-
-            # Create lineage relationships
-            if marquez_url:
-                self.setup_marquez(marquez_url, marquez_api_key)
-                print(f"\n🔗 Starting to create lineage to Marquez ({marquez_url})...")
-
-                for table in glue_tables:
-                    self._create_table_lineage(glue_database, redshift_schema, table)
-
-                print(
-                    f"\n🎉 Lineage creation completed! "
-                    f"Processed {len(glue_tables)} tables"
-                )
-            else:
-                print(
-                    "\n✅ External schema creation completed, "
-                    "skipping lineage creation"
-                )
-
-        finally:
-            self.redshift.disconnect()
+        # Create external schema
+        ddl = self.redshift.create_external_schema(
+            redshift_schema, glue_database, iam_role
+        )
+        print(f"\n=== Executed DDL ===\n{ddl}")
+
+        # Create lineage relationships
+        if marquez_url:
+            self.setup_marquez(marquez_url, marquez_api_key)
+            print(f"\n🔗 Starting to create lineage to Marquez ({marquez_url})...")
+
+            # All events of this database share one timestamp
+            run_started = datetime.now(BEIJING_TZ)
+
+            # Tables are independent, create their lineage concurrently while
+            # later Glue pages are still being fetched
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._create_table_lineage,
+                        redshift_schema,
+                        glue_metadata,
+                        run_started,
+                    )
+                    for glue_metadata in itertools.chain([first_table], glue_tables)
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
+            print(f"\n🎉 Lineage creation completed! Processed {len(futures)} tables")
+        else:
+            print("\n✅ External schema creation completed, skipping lineage creation")
 
     def _create_table_lineage(
-        self, glue_database: str, redshift_schema: str, table_name: str
+        self,
+        redshift_schema: str,
+        glue_metadata: Dict[str, Any],
+        run_started: datetime,
     ):
-        """Create lineage for a single table"""
+        """Create lineage for a single table from its Glue metadata"""
+        table_name = glue_metadata["table_name"]
         try:
-            # Get Glue metadata
-            glue_metadata = self.glue.get_table_metadata(glue_database, table_name)
-
             # Extract identification information
-            source_namespace = self.glue.extract_namespace(glue_metadata)
-            source_dataset = self.glue.extract_dataset(glue_metadata)
+            source_namespace, source_dataset = self.glue.extract_namespace_and_dataset(
+                glue_metadata
+            )
 
             # Build target information
             redshift_database = self.redshift.config.get("database", "redshift")
             target_dataset = f"{redshift_database}.{redshift_schema}.{table_name}"
 
-            # Build field information and lineage
-            source_fields = []
-            target_fields = []
-            column_lineage = []
-
-            for col in glue_metadata["columns"]:
-                field_info = {
+            # Build field information and lineage, source and target share the
+            # same fields since columns map 1:1
+            columns = glue_metadata["columns"]
+            source_fields = [
+                {
                     "name": col["name"],
                     "type": col["type"],
                     "description": col.get("comment", ""),
                 }
-                source_fields.append(field_info)
-                target_fields.append(field_info)
-
-                column_lineage.append(
-                    {
-                        "name": col["name"],
-                        "inputFields": [
-                            {
-                                "namespace": source_namespace,
-                                "name": source_dataset,
-                                "field": col["name"],
-                            }
-                        ],
-                        "transformationDescription": (
-                            "Direct mapping from Glue table to Redshift "
-                            "external table"
-                        ),
-                        "transformationType": "IDENTITY",
-                    }
-                )
+                for col in columns
+            ]
+            target_fields = source_fields
+            column_lineage = [
+                {
+                    "name": col["name"],
+                    "inputFields": [
+                        {
+                            "namespace": source_namespace,
+                            "name": source_dataset,
+                            "field": col["name"],
+                        }
+                    ],
+                    "transformationDescription": DIRECT_MAPPING_DESCRIPTION,
+                    "transformationType": "IDENTITY",
+                }
+                for col in columns
+            ]
 
             # First create source and target datasets
             # 只有在数据集第一次创建时有用
@@ -482,17 +540,20 @@ class IcebergLineageConverter:
 
             # Send lineage event
             job_name = f"glue_to_redshift_{table_name}"
+            # One write per table keeps concurrent workers' output from interleaving
             print(
-                f"  📊 Sending column-level lineage, "
-                f"{len(column_lineage)} field mappings"
-            )
-            for col_mapping in column_lineage:
-                input_field = col_mapping["inputFields"][0]
-                print(
-                    f"    - {col_mapping['name']}: "
-                    f"{input_field['namespace']}.{input_field['name']}."
-                    f"{input_field['field']}"
+                "\n".join(
+                    [
+                        f"  📊 Sending column-level lineage, "
+                        f"{len(column_lineage)} field mappings",
+                        *(
+                            f"    - {col['name']}: "
+                            f"{source_namespace}.{source_dataset}.{col['name']}"
+                            for col in column_lineage
+                        ),
+                    ]
                 )
+            )
 
             self.marquez.send_lineage_event(
                 source_namespace=source_namespace,
@@ -503,6 +564,9 @@ class IcebergLineageConverter:
                 source_fields=source_fields,
                 target_fields=target_fields,
                 column_lineage=column_lineage,
+                # Each table job gets its own run, grouped by the shared timestamp
+                run_id=f"run_{int(run_started.timestamp())}_{table_name}",
+                event_time=run_started.isoformat(),
             )
 
             print(
@@ -518,7 +582,7 @@ def load_config(config_file: str) -> Dict[str, Any]:
     """Load YAML configuration file"""
     try:
         with open(config_file, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_file}")
     except yaml.YAMLError as e:
@@ -544,6 +608,12 @@ def main():
     parser.add_argument("--aws-profile", help="AWS Profile name")
     parser.add_argument("--marquez-url", help="Marquez API URL")
     parser.add_argument("--marquez-api-key", help="Marquez API key")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Tables processed concurrently (default: {DEFAULT_WORKERS})",
+    )
 
     args = parser.parse_args()
 
@@ -584,7 +654,9 @@ def main():
     marquez_api_key = args.marquez_api_key or os.getenv("MARQUEZ_API_KEY")
 
     # Create converter
-    converter = IcebergLineageConverter(redshift_config, args.aws_profile)
+    converter = IcebergLineageConverter(
+        redshift_config, args.aws_profile, max_workers=args.workers
+    )
 
     print(f"📋 Starting to process {len(databases)} Glue databases:")
     for db in databases:
@@ -595,22 +667,25 @@ def main():
     else:
         print("ℹ️  Marquez URL not configured, will skip lineage creation")
 
-    # Process each database
+    # Process each database over one Redshift connection
     success_count = 0
-    for glue_database in databases:
-        print(f"\n🔄 Processing database: {glue_database}")
-        try:
-            converter.create_schema_and_lineage(
-                glue_database=glue_database,
-                redshift_schema=redshift_schema,
-                iam_role=args.iam_role,
-                marquez_url=marquez_url,
-                marquez_api_key=marquez_api_key,
-            )
-            success_count += 1
-            print(f"✅ Database processed successfully: {glue_database}")
-        except Exception as e:
-            print(f"❌ Failed to process database: {glue_database}, error: {e}")
+    try:
+        for glue_database in databases:
+            print(f"\n🔄 Processing database: {glue_database}")
+            try:
+                converter.create_schema_and_lineage(
+                    glue_database=glue_database,
+                    redshift_schema=redshift_schema,
+                    iam_role=args.iam_role,
+                    marquez_url=marquez_url,
+                    marquez_api_key=marquez_api_key,
+                )
+                success_count += 1
+                print(f"✅ Database processed successfully: {glue_database}")
+            except Exception as e:
+                print(f"❌ Failed to process database: {glue_database}, error: {e}")
+    finally:
+        converter.redshift.disconnect()
 
     print(f"\n🎉 Processing completed! Success: {success_count}/{len(databases)}")
     return 0 if success_count == len(databases) else 1
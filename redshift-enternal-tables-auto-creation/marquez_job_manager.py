@@ -5,33 +5,70 @@ Used to query all jobs, keep the latest set of jobs, and delete expired jobs
 from the same node
 """
 
+import heapq
+import itertools
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
+from urllib.parse import quote
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Concurrent DELETE requests against Marquez
+DEFAULT_MAX_WORKERS = 10
+# Jobs requested per page, deep pages get slower so keep them small
+JOBS_PAGE_SIZE = 100
+# Offsets past this get expensive for Marquez, larger listings are split by namespace
+DEEP_OFFSET_LIMIT = 10_000
+# (connect, read) timeouts so a stalled request can't hang a worker thread
+HTTP_TIMEOUT = (3.05, 30)
+# Sort key for jobs and runs without a usable createdAt, built once
+MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
 
 class MarquezJobManager:
     """Marquez Job Manager"""
 
-    def __init__(self, base_url: str, api_key: str = None):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
         """
         Initialize Marquez Job Manager
 
         Args:
             base_url: Marquez API base URL
             api_key: API key (optional)
+            max_workers: Number of concurrent delete requests
         """
         self.base_url = base_url.rstrip("/")
+        self._jobs_url = f"{self.base_url}/api/v1/jobs"
+        self._namespaces_url = f"{self.base_url}/api/v1/namespaces"
+        self.max_workers = max_workers
         self.session = requests.Session()
+        # One pooled connection per worker so threads don't wait on checkout, and
+        # retry transient errors instead of re-running the whole cleanup
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "DELETE"],
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
         if api_key:
             self.session.headers.update({"Authorization": f"Bearer {api_key}"})
@@ -40,11 +77,11 @@ class MarquezJobManager:
             {"Content-Type": "application/json", "Accept": "application/json"}
         )
 
-    def get_all_jobs(
-        self, namespace: str = None, limit: int = 1000, offset: int = 0
-    ) -> List[Dict[str, Any]]:
+    def get_jobs_page(
+        self, namespace: str = None, limit: int = JOBS_PAGE_SIZE, offset: int = 0
+    ) -> Dict[str, Any]:
         """
-        Get all jobs
+        Get one page of jobs
 
         Args:
             namespace: Namespace filter (optional)
@@ -52,27 +89,135 @@ class MarquezJobManager:
             offset: Offset
 
         Returns:
-            List of jobs
+            Response data with "jobs" and, when provided, "totalCount"
         """
         try:
-            url = f"{self.base_url}/api/v1/jobs"
             params = {"limit": limit, "offset": offset}
 
             if namespace:
                 params["namespace"] = namespace
 
-            response = self.session.get(url, params=params)
+            response = self.session.get(
+                self._jobs_url, params=params, timeout=HTTP_TIMEOUT
+            )
             response.raise_for_status()
 
-            data = response.json()
+            # Job listings carry full facets, orjson decodes them much faster
+            return orjson.loads(response.content)
+
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Failed to get jobs: %s", e)
+            raise
+
+    def iter_all_jobs(
+        self, namespace: str = None, page_size: int = JOBS_PAGE_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all jobs, fetching pages on demand
+
+        Args:
+            namespace: Namespace filter (optional)
+            page_size: Jobs per request, capped at JOBS_PAGE_SIZE
+
+        Yields:
+            Jobs in the order returned by Marquez
+        """
+        page_size = min(page_size, JOBS_PAGE_SIZE)
+        data = self.get_jobs_page(namespace, limit=page_size, offset=0)
+
+        # Marquez has no cursor, so instead of paging deep into the unfiltered
+        # listing walk each namespace separately with small offsets
+        if namespace is None and data.get("totalCount", 0) > DEEP_OFFSET_LIMIT:
+            logger.warning(
+                "%d jobs exceed offset limit %d, listing jobs per namespace",
+                data["totalCount"],
+                DEEP_OFFSET_LIMIT,
+            )
+            for job_namespace in self.iter_namespaces():
+                yield from self.iter_all_jobs(job_namespace, page_size=page_size)
+            return
+
+        offset = 0
+        while True:
             jobs = data.get("jobs", [])
+            yield from jobs
+
+            offset += len(jobs)
+            # Stop on a short page or once totalCount is read
+            if len(jobs) < page_size or offset >= data.get("totalCount", offset + 1):
+                break
+
+            if offset - len(jobs) < DEEP_OFFSET_LIMIT <= offset:
+                logger.warning(
+                    "Namespace %s has more than %d jobs, deep pages will be slow",
+                    namespace,
+                    DEEP_OFFSET_LIMIT,
+                )
+            data = self.get_jobs_page(namespace, limit=page_size, offset=offset)
 
-            logger.info(f"Retrieved {len(jobs)} jobs")
-            return jobs
+    def iter_namespaces(self) -> Iterator[str]:
+        """
+        Iterate over all namespace names
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get jobs: {e}")
-            raise
+        Yields:
+            Namespace names
+        """
+        offset = 0
+
+        while True:
+            try:
+                response = self.session.get(
+                    self._namespaces_url,
+                    params={"limit": JOBS_PAGE_SIZE, "offset": offset},
+                    timeout=HTTP_TIMEOUT,
+                )
+                response.raise_for_status()
+                namespaces = orjson.loads(response.content).get("namespaces", [])
+
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                logger.error("Failed to get namespaces: %s", e)
+                raise
+
+            for namespace in namespaces:
+                yield namespace["name"]
+
+            if len(namespaces) < JOBS_PAGE_SIZE:
+                break
+            offset += len(namespaces)
+
+    def get_all_jobs(
+        self, namespace: str = None, page_size: int = JOBS_PAGE_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all jobs
+
+        Args:
+            namespace: Namespace filter (optional)
+            page_size: Jobs per request
+
+        Returns:
+            List of jobs
+        """
+        jobs = list(self.iter_all_jobs(namespace=namespace, page_size=page_size))
+        logger.info("Retrieved %d jobs", len(jobs))
+        return jobs
+
+    def _job_url(self, namespace: str, job_name: str) -> str:
+        """
+        Build job URL
+
+        Args:
+            namespace: Namespace
+            job_name: Job name
+
+        Returns:
+            Job URL
+        """
+        # URL encode namespace and job_name to handle special characters
+        return (
+            f"{self._namespaces_url}/{quote(namespace, safe='')}/"
+            f"jobs/{quote(job_name, safe='')}"
+        )
 
     def get_job_runs(
         self, namespace: str, job_name: str, limit: int = 100
@@ -89,29 +234,22 @@ class MarquezJobManager:
             List of job run records
         """
         try:
-            from urllib.parse import quote
-
-            # URL encode namespace and job_name to handle special characters
-            encoded_namespace = quote(namespace, safe="")
-            encoded_job_name = quote(job_name, safe="")
-
-            url = (
-                f"{self.base_url}/api/v1/namespaces/{encoded_namespace}/"
-                f"jobs/{encoded_job_name}/runs"
+            url = f"{self._job_url(namespace, job_name)}/runs"
+            response = self.session.get(
+                url, params={"limit": limit}, timeout=HTTP_TIMEOUT
             )
-            params = {"limit": limit}
-
-            response = self.session.get(url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             runs = data.get("runs", [])
 
-            logger.debug(f"Job {namespace}.{job_name} has {len(runs)} run records")
+            logger.debug("Job %s.%s has %d run records", namespace, job_name, len(runs))
             return runs
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get job run records: {namespace}.{job_name} - {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(
+                "Failed to get job run records: %s.%s - %s", namespace, job_name, e
+            )
             return []
 
     def delete_job_run(self, namespace: str, job_name: str, run_id: str) -> bool:
@@ -127,29 +265,25 @@ class MarquezJobManager:
             Whether deletion was successful
         """
         try:
-            from urllib.parse import quote
-
-            # URL encode namespace and job_name to handle special characters
-            encoded_namespace = quote(namespace, safe="")
-            encoded_job_name = quote(job_name, safe="")
-            encoded_run_id = quote(run_id, safe="")
-
-            url = (
-                f"{self.base_url}/api/v1/namespaces/{encoded_namespace}/"
-                f"jobs/{encoded_job_name}/runs/{encoded_run_id}"
-            )
-            response = self.session.delete(url)
+            url = f"{self._job_url(namespace, job_name)}/runs/{quote(run_id, safe='')}"
+            response = self.session.delete(url, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
 
             logger.info(
-                f"Successfully deleted job run record: {namespace}.{job_name}#{run_id}"
+                "Successfully deleted job run record: %s.%s#%s",
+                namespace,
+                job_name,
+                run_id,
             )
             return True
 
         except requests.exceptions.RequestException as e:
             logger.error(
-                f"Failed to delete job run record: "
-                f"{namespace}.{job_name}#{run_id} - {e}"
+                "Failed to delete job run record: %s.%s#%s - %s",
+                namespace,
+                job_name,
+                run_id,
+                e,
             )
             return False
 
@@ -165,34 +299,44 @@ class MarquezJobManager:
             Whether deletion was successful
         """
         try:
-            from urllib.parse import quote
-
-            # URL encode namespace and job_name to handle special characters
-            encoded_namespace = quote(namespace, safe="")
-            encoded_job_name = quote(job_name, safe="")
-
-            url = (
-                f"{self.base_url}/api/v1/namespaces/{encoded_namespace}/"
-                f"jobs/{encoded_job_name}"
+            response = self.session.delete(
+                self._job_url(namespace, job_name), timeout=HTTP_TIMEOUT
             )
-            response = self.session.delete(url)
             response.raise_for_status()
 
-            logger.info(f"Successfully deleted job: {namespace}.{job_name}")
+            logger.info("Successfully deleted job: %s.%s", namespace, job_name)
             return True
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to delete job: {namespace}.{job_name} - {e}")
+            logger.error("Failed to delete job: %s.%s - %s", namespace, job_name, e)
             return False
 
+    def _run_deletes(self, delete_func, targets: List[tuple]) -> int:
+        """
+        Run delete requests concurrently
+
+        Args:
+            delete_func: Delete method, returns whether deletion was successful
+            targets: Argument tuples for each delete call
+
+        Returns:
+            Number of successful deletions
+        """
+        if not targets:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(delete_func, *target) for target in targets]
+            return sum(1 for future in as_completed(futures) if future.result())
+
     def group_jobs_by_dataset(
-        self, jobs: List[Dict[str, Any]]
+        self, jobs: Iterable[Dict[str, Any]]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Group jobs by dataset - dataset-centric grouping strategy
 
         Args:
-            jobs: List of jobs
+            jobs: Jobs, any iterable including iter_all_jobs()
 
         Returns:
             Dictionary of jobs grouped by dataset, key is dataset identifier,
@@ -201,41 +345,58 @@ class MarquezJobManager:
         grouped_jobs = defaultdict(list)
 
         for job in jobs:
-            # Get job's output datasets
-            outputs = job.get("outputs", [])
-
-            if outputs:
-                # If job has outputs, group by output dataset
-                for output in outputs:
-                    dataset_key = self._extract_dataset_key(output)
-                    if dataset_key:
-                        grouped_jobs[dataset_key].append(job)
-            else:
-                # If no outputs, try to group by input dataset
-                inputs = job.get("inputs", [])
-                if inputs:
-                    for input_ds in inputs:
-                        dataset_key = self._extract_dataset_key(input_ds)
-                        if dataset_key:
-                            grouped_jobs[dataset_key].append(job)
-                else:
-                    # If neither inputs nor outputs, group by job name
-                    # (fallback strategy)
-                    job_namespace = job.get("namespace", "")
-                    if isinstance(job_namespace, dict):
-                        job_namespace = job_namespace.get("name", "")
-                    elif not isinstance(job_namespace, str):
-                        job_namespace = str(job_namespace)
-
-                    job_name = job.get("name", "")
-                    fallback_key = f"{job_namespace}::{job_name}"
-                    grouped_jobs[fallback_key].append(job)
+            for dataset_key in self._get_dataset_keys(job):
+                grouped_jobs[dataset_key].append(job)
 
         logger.info(
-            f"Jobs grouped by dataset completed, {len(grouped_jobs)} datasets total"
+            "Jobs grouped by dataset completed, %d datasets total", len(grouped_jobs)
         )
         return dict(grouped_jobs)
 
+    def _get_dataset_keys(self, job: Dict[str, Any]) -> List[str]:
+        """
+        Get identifiers of the datasets a job is grouped under
+
+        Args:
+            job: Job information
+
+        Returns:
+            Dataset identifiers
+        """
+        # Get job's output datasets
+        outputs = job.get("outputs", [])
+
+        if outputs:
+            # If job has outputs, group by output dataset
+            datasets = outputs
+        else:
+            # If no outputs, try to group by input dataset
+            datasets = job.get("inputs", [])
+            if not datasets:
+                # If neither inputs nor outputs, group by job name
+                # (fallback strategy)
+                return [f"{self._get_job_namespace(job)}::{job.get('name', '')}"]
+
+        return [key for key in map(self._extract_dataset_key, datasets) if key]
+
+    def _get_job_namespace(self, job: Dict[str, Any]) -> str:
+        """
+        Get job namespace name
+
+        Args:
+            job: Job information
+
+        Returns:
+            Namespace name
+        """
+        # Handle different namespace formats
+        job_namespace = job.get("namespace", "")
+        if isinstance(job_namespace, dict):
+            return job_namespace.get("name", "")
+        elif not isinstance(job_namespace, str):
+            return str(job_namespace)
+        return job_namespace
+
     def _extract_dataset_key(self, dataset: Dict[str, Any]) -> str:
         """
         Extract unique identifier from dataset information
@@ -258,13 +419,13 @@ class MarquezJobManager:
         return ""
 
     def group_jobs_by_node(
-        self, jobs: List[Dict[str, Any]]
+        self, jobs: Iterable[Dict[str, Any]]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Group jobs by node (namespace + job name prefix) - compatible with old method
 
         Args:
-            jobs: List of jobs
+            jobs: Jobs, any iterable including iter_all_jobs()
 
         Returns:
             Dictionary of jobs grouped by node
@@ -272,22 +433,24 @@ class MarquezJobManager:
         grouped_jobs = defaultdict(list)
 
         for job in jobs:
-            # Handle different namespace formats
-            namespace = job.get("namespace", "")
-            if isinstance(namespace, dict):
-                namespace = namespace.get("name", "")
-            elif not isinstance(namespace, str):
-                namespace = str(namespace)
+            grouped_jobs[self._get_node_key(job)].append(job)
 
-            job_name = job.get("name", "")
+        logger.info("Jobs grouped by node completed, %d nodes total", len(grouped_jobs))
+        return dict(grouped_jobs)
 
-            # Extract node identifier (can adjust grouping logic based on actual needs)
-            # Assumes job name format: node_name_timestamp or node_name_version
-            node_key = self._extract_node_key(namespace, job_name)
-            grouped_jobs[node_key].append(job)
+    def _get_node_key(self, job: Dict[str, Any]) -> str:
+        """
+        Get node identifier of a job
 
-        logger.info(f"Jobs grouped by node completed, {len(grouped_jobs)} nodes total")
-        return dict(grouped_jobs)
+        Args:
+            job: Job information
+
+        Returns:
+            Node identifier
+        """
+        # Extract node identifier (can adjust grouping logic based on actual needs)
+        # Assumes job name format: node_name_timestamp or node_name_version
+        return self._extract_node_key(self._get_job_namespace(job), job.get("name", ""))
 
     def _extract_node_key(self, namespace: str, job_name: str) -> str:
         """
@@ -304,25 +467,19 @@ class MarquezJobManager:
         if job_name.startswith("nativespark_"):
             # For nativespark_xxx_jr_hash format job names
             # Extract base name, remove hash part after jr_
-            parts = job_name.split("_jr_")
-            if len(parts) >= 2:
-                base_name = parts[0]  # e.g.: nativespark_glue_customers
+            base_name, separator, _ = job_name.partition("_jr_")
+            if separator:
+                # e.g.: nativespark_glue_customers
                 return f"{namespace}::{base_name}"
 
-        # Handle other format job names
-        parts = job_name.split("_")
-        if len(parts) > 1:
-            # Check if last part looks like timestamp or version number
-            last_part = parts[-1]
-            # If last part is number (timestamp) or version number starting
-            # with v, remove it
-            if (last_part.isdigit() and len(last_part) >= 6) or last_part.startswith(
-                "v"
-            ):
-                node_name = "_".join(parts[:-1])
-            else:
-                node_name = job_name
-        else:
+        # Handle other format job names, partition instead of split so no
+        # intermediate list is built for every job
+        node_name, separator, last_part = job_name.rpartition("_")
+        # If last part is number (timestamp) or version number starting
+        # with v, remove it
+        if not separator or not (
+            (last_part.isdigit() and len(last_part) >= 6) or last_part.startswith("v")
+        ):
             node_name = job_name
 
         return f"{namespace}::{node_name}"
@@ -346,18 +503,28 @@ class MarquezJobManager:
                 continue
 
             # Sort by creation time, find the latest job
-            latest_job = max(
-                jobs, key=lambda x: self._parse_datetime(x.get("createdAt", ""))
-            )
+            latest_job = max(jobs, key=self._created_at)
             latest_jobs[node_key] = latest_job
 
             logger.debug(
-                f"Latest job for node {node_key}: {latest_job.get('name', '')}"
+                "Latest job for node %s: %s", node_key, latest_job.get("name", "")
             )
 
-        logger.info(f"Found latest jobs for {len(latest_jobs)} nodes")
+        logger.info("Found latest jobs for %d nodes", len(latest_jobs))
         return latest_jobs
 
+    def _created_at(self, item: Dict[str, Any]) -> datetime:
+        """
+        Get creation time of a job or run record, used as sort key
+
+        Args:
+            item: Job or run record
+
+        Returns:
+            datetime object
+        """
+        return self._parse_datetime(item.get("createdAt", ""))
+
     def _parse_datetime(self, datetime_str: str) -> datetime:
         """
         Parse datetime string
@@ -368,18 +535,15 @@ class MarquezJobManager:
         Returns:
             datetime object
         """
+        if not datetime_str:
+            return MIN_DATETIME
+
         try:
-            # Try to parse ISO format datetime
-            if datetime_str:
-                # Handle possible timezone information
-                if datetime_str.endswith("Z"):
-                    datetime_str = datetime_str[:-1] + "+00:00"
-                return datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
-            else:
-                return datetime.min.replace(tzinfo=timezone.utc)
+            # Try to parse ISO format datetime, fromisoformat accepts the "Z" suffix
+            return datetime.fromisoformat(datetime_str)
         except ValueError:
-            logger.warning(f"Unable to parse datetime: {datetime_str}")
-            return datetime.min.replace(tzinfo=timezone.utc)
+            logger.warning("Unable to parse datetime: %s", datetime_str)
+            return MIN_DATETIME
 
     def cleanup_old_jobs(
         self,
@@ -403,75 +567,79 @@ class MarquezJobManager:
         """
         group_type = "dataset" if group_by_dataset else "node"
         logger.info(
-            f"Starting to clean up expired jobs (grouped by {group_type}, "
-            f"keep latest {keep_latest_count}, dry run: {dry_run})"
+            "Starting to clean up expired jobs (grouped by %s, "
+            "keep latest %d, dry run: %s)",
+            group_type,
+            keep_latest_count,
+            dry_run,
         )
 
-        # Get all jobs
-        all_jobs = self.get_all_jobs(namespace=namespace)
-
-        if not all_jobs:
-            logger.info("No jobs found")
-            return {"total_jobs": 0, "deleted_jobs": 0, "kept_jobs": 0}
-
-        # Group by dataset or node
-        if group_by_dataset:
-            grouped_jobs = self.group_jobs_by_dataset(all_jobs)
-        else:
-            grouped_jobs = self.group_jobs_by_node(all_jobs)
+        total_jobs = 0
+        # Group key -> min-heap of (created at, order, job key) for jobs kept so far
+        kept_jobs = defaultdict(list)
+        deleted_per_group = defaultdict(int)
+        jobs_to_delete = []
+
+        # Single pass over the job pages: each group only holds its latest jobs,
+        # older ones are pushed out to the delete list as newer ones arrive
+        for order, job in enumerate(self.iter_all_jobs(namespace=namespace)):
+            total_jobs += 1
+            # Normalize the job's identity once, it is reused for every group
+            job_key = (self._get_job_namespace(job), job.get("name", ""))
+            if group_by_dataset:
+                group_keys = self._get_dataset_keys(job)
+            else:
+                group_keys = [self._extract_node_key(*job_key)]
 
-        deleted_count = 0
-        kept_count = 0
+            # Negated order keeps the first listed job on equal timestamps
+            entry = (self._created_at(job), -order, job_key)
 
-        for group_key, jobs in grouped_jobs.items():
-            # Sort by creation time (latest first)
-            sorted_jobs = sorted(
-                jobs,
-                key=lambda x: self._parse_datetime(x.get("createdAt", "")),
-                reverse=True,
-            )
+            for group_key in group_keys:
+                heap = kept_jobs[group_key]
+                if len(heap) < keep_latest_count:
+                    heapq.heappush(heap, entry)
+                    continue
 
-            # Keep the latest specified number of jobs
-            jobs_to_keep = sorted_jobs[:keep_latest_count]
-            jobs_to_delete = sorted_jobs[keep_latest_count:]
+                expired = heapq.heappushpop(heap, entry) if heap else entry
+                deleted_per_group[group_key] += 1
+                jobs_to_delete.append(expired[2])
 
-            kept_count += len(jobs_to_keep)
+        if not total_jobs:
+            logger.info("No jobs found")
+            return {"total_jobs": 0, "deleted_jobs": 0, "kept_jobs": 0}
 
-            if len(jobs_to_delete) > 0:
+        for group_key, heap in kept_jobs.items():
+            if deleted_per_group[group_key]:
                 logger.info(
-                    f"{group_type} {group_key}: keep {len(jobs_to_keep)} jobs, "
-                    f"delete {len(jobs_to_delete)} jobs"
+                    "%s %s: keep %d jobs, delete %d jobs",
+                    group_type,
+                    group_key,
+                    len(heap),
+                    deleted_per_group[group_key],
                 )
 
-            # Delete expired jobs
-            for job in jobs_to_delete:
-                # Handle different namespace formats
-                job_namespace = job.get("namespace", "")
-                if isinstance(job_namespace, dict):
-                    job_namespace = job_namespace.get("name", "")
-                elif not isinstance(job_namespace, str):
-                    job_namespace = str(job_namespace)
-
-                job_name = job.get("name", "")
-
-                if not dry_run:
-                    if self.delete_job(job_namespace, job_name):
-                        deleted_count += 1
-                else:
-                    logger.info(
-                        f"[Dry run] Will delete job: {job_namespace}.{job_name}"
-                    )
-                    deleted_count += 1
+        # Jobs are only deleted once listing is done, deleting earlier would
+        # shift the offsets of the remaining pages
+        if not dry_run:
+            # A job expired in several dataset groups needs only one DELETE, the
+            # repeats would just fail with 404
+            deleted_count = self._run_deletes(
+                self.delete_job, list(dict.fromkeys(jobs_to_delete))
+            )
+        else:
+            for job_namespace, job_name in jobs_to_delete:
+                logger.info("[Dry run] Will delete job: %s.%s", job_namespace, job_name)
+            deleted_count = len(jobs_to_delete)
 
         result = {
-            "total_jobs": len(all_jobs),
+            "total_jobs": total_jobs,
             "deleted_jobs": deleted_count,
-            "kept_jobs": kept_count,
-            "groups_processed": len(grouped_jobs),
+            "kept_jobs": sum(len(heap) for heap in kept_jobs.values()),
+            "groups_processed": len(kept_jobs),
             "group_type": group_type,
         }
 
-        logger.info(f"Cleanup completed: {result}")
+        logger.info("Cleanup completed: %s", result)
         return result
 
     def cleanup_old_job_runs(
@@ -490,80 +658,98 @@ class MarquezJobManager:
             Cleanup result statistics
         """
         logger.info(
-            f"Starting to clean up expired job run records "
-            f"(keep latest {keep_latest_runs}, dry run: {dry_run})"
+            "Starting to clean up expired job run records "
+            "(keep latest %d, dry run: %s)",
+            keep_latest_runs,
+            dry_run,
         )
 
-        # Get all jobs
-        all_jobs = self.get_all_jobs(namespace=namespace)
-
-        if not all_jobs:
-            logger.info("No jobs found")
-            return {"total_runs": 0, "deleted_runs": 0, "kept_runs": 0}
-
         total_runs = 0
         deleted_runs = 0
         kept_runs = 0
+        jobs_processed = 0
 
-        for job in all_jobs:
-            # Handle different namespace formats
-            job_namespace = job.get("namespace", "")
-            if isinstance(job_namespace, dict):
-                job_namespace = job_namespace.get("name", "")
-            elif not isinstance(job_namespace, str):
-                job_namespace = str(job_namespace)
-
-            job_name = job.get("name", "")
-
-            # Get all run records for the job
-            runs = self.get_job_runs(job_namespace, job_name)
-
-            if not runs:
-                continue
-
-            total_runs += len(runs)
-
-            # Sort by creation time (latest first)
-            sorted_runs = sorted(
-                runs,
-                key=lambda x: self._parse_datetime(x.get("createdAt", "")),
-                reverse=True,
-            )
-
-            # Keep the latest specified number of run records
-            runs_to_keep = sorted_runs[:keep_latest_runs]
-            runs_to_delete = sorted_runs[keep_latest_runs:]
-
-            kept_runs += len(runs_to_keep)
-
-            if runs_to_delete:
-                logger.info(
-                    f"Job {job_namespace}.{job_name}: keep {len(runs_to_keep)} "
-                    f"run records, delete {len(runs_to_delete)} run records"
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Work through jobs one page at a time so memory stays bounded
+            for jobs in itertools.batched(
+                self.iter_all_jobs(namespace=namespace), JOBS_PAGE_SIZE
+            ):
+                jobs_processed += len(jobs)
+                delete_futures = []
+
+                job_keys = [
+                    (self._get_job_namespace(job), job.get("name", "")) for job in jobs
+                ]
+
+                # Get run records for the page's jobs concurrently, in job order
+                all_runs = executor.map(lambda key: self.get_job_runs(*key), job_keys)
+
+                for (job_namespace, job_name), runs in zip(job_keys, all_runs):
+                    if not runs:
+                        continue
+
+                    total_runs += len(runs)
+
+                    # Nothing expires, no need to sort
+                    if len(runs) <= keep_latest_runs:
+                        kept_runs += len(runs)
+                        continue
+
+                    # Sort by creation time (latest first)
+                    sorted_runs = sorted(runs, key=self._created_at, reverse=True)
+
+                    # Keep the latest specified number of run records
+                    runs_to_keep = sorted_runs[:keep_latest_runs]
+                    runs_to_delete = sorted_runs[keep_latest_runs:]
+
+                    kept_runs += len(runs_to_keep)
+
+                    if runs_to_delete:
+                        logger.info(
+                            "Job %s.%s: keep %d run records, delete %d run records",
+                            job_namespace,
+                            job_name,
+                            len(runs_to_keep),
+                            len(runs_to_delete),
+                        )
+
+                    # Delete expired run records
+                    for run in runs_to_delete:
+                        run_id = run.get("id", "")
+
+                        if not dry_run:
+                            # Start deleting as soon as this job's runs are known,
+                            # interleaved with the remaining run fetches
+                            delete_futures.append(
+                                executor.submit(
+                                    self.delete_job_run, job_namespace, job_name, run_id
+                                )
+                            )
+                        else:
+                            logger.info(
+                                "[Dry run] Will delete run record: %s.%s#%s",
+                                job_namespace,
+                                job_name,
+                                run_id,
+                            )
+                            deleted_runs += 1
+
+                deleted_runs += sum(
+                    1 for future in as_completed(delete_futures) if future.result()
                 )
 
-            # Delete expired run records
-            for run in runs_to_delete:
-                run_id = run.get("id", "")
-
-                if not dry_run:
-                    if self.delete_job_run(job_namespace, job_name, run_id):
-                        deleted_runs += 1
-                else:
-                    logger.info(
-                        f"[Dry run] Will delete run record: "
-                        f"{job_namespace}.{job_name}#{run_id}"
-                    )
-                    deleted_runs += 1
+        if not jobs_processed:
+            logger.info("No jobs found")
+            return {"total_runs": 0, "deleted_runs": 0, "kept_runs": 0}
 
         result = {
             "total_runs": total_runs,
             "deleted_runs": deleted_runs,
             "kept_runs": kept_runs,
-            "jobs_processed": len(all_jobs),
+            "jobs_processed": jobs_processed,
         }
 
-        logger.info(f"Run record cleanup completed: {result}")
+        logger.info("Run record cleanup completed: %s", result)
         return result
 
     def get_job_statistics(self, namespace: str = None) -> Dict[str, Any]:
@@ -576,34 +762,25 @@ class MarquezJobManager:
         Returns:
             Statistics information
         """
-        all_jobs = self.get_all_jobs(namespace=namespace)
-        grouped_jobs = self.group_jobs_by_node(all_jobs)
-
-        stats = {
-            "total_jobs": len(all_jobs),
-            "total_nodes": len(grouped_jobs),
-            "jobs_per_node": {},
-            "namespaces": set(),
+        jobs_per_node = Counter()
+        namespaces = set()
+
+        # Only counts are needed, so jobs are not kept once they are counted
+        for job in self.iter_all_jobs(namespace=namespace):
+            job_namespace = self._get_job_namespace(job)
+            node_key = self._extract_node_key(job_namespace, job.get("name", ""))
+            jobs_per_node[node_key] += 1
+
+            if job_namespace:
+                namespaces.add(job_namespace)
+
+        return {
+            "total_jobs": jobs_per_node.total(),
+            "total_nodes": len(jobs_per_node),
+            "jobs_per_node": dict(jobs_per_node),
+            "namespaces": list(namespaces),
         }
 
-        for node_key, jobs in grouped_jobs.items():
-            stats["jobs_per_node"][node_key] = len(jobs)
-
-            for job in jobs:
-                # Handle different namespace formats
-                job_namespace = job.get("namespace", "")
-                if isinstance(job_namespace, dict):
-                    job_namespace = job_namespace.get("name", "")
-                elif not isinstance(job_namespace, str):
-                    job_namespace = str(job_namespace)
-
-                if job_namespace:
-                    stats["namespaces"].add(job_namespace)
-
-        stats["namespaces"] = list(stats["namespaces"])
-
-        return stats
-
 
 def main():
     """Example usage"""
@@ -614,6 +791,12 @@ def main():
 
     load_dotenv()
 
+    # Configure logging here rather than at import, so importing the manager
+    # leaves the caller's logging setup alone
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
     parser = argparse.ArgumentParser(description="Marquez Job Manager")
     parser.add_argument(
         "--marquez-url", default=os.getenv("MARQUEZ_URL"), help="Marquez API URL"
@@ -637,6 +820,12 @@ def main():
         "--keep-runs", type=int, default=5, help="Number of run records to keep per job"
     )
     parser.add_argument("--dry-run", action="store_true", help="Dry run mode")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Concurrent delete requests (default: {DEFAULT_MAX_WORKERS})",
+    )
     parser.add_argument(
         "--group-by-node",
         action="store_true",
@@ -650,7 +839,9 @@ def main():
         return
 
     # Create manager
-    manager = MarquezJobManager(args.marquez_url, args.marquez_api_key)
+    manager = MarquezJobManager(
+        args.marquez_url, args.marquez_api_key, max_workers=args.workers
+    )
 
     try:
         if args.action == "stats":
@@ -692,7 +883,7 @@ def main():
             print(f"Processed jobs: {result['jobs_processed']}")
 
     except Exception as e:
-        logger.error(f"Operation failed: {e}")
+        logger.error("Operation failed: %s", e)
         raise
 
 